@@ -0,0 +1,21 @@
+# SupportiveScripts/install_browsers.py
+"""
+Script to install the Chromium build Playwright drives.
+Run this once after installing requirements, instead of relying on the
+workers to install it when the browser fails to start.
+"""
+
+import subprocess
+import sys
+
+
+def install_browsers():
+    """Install Chromium for Playwright."""
+    result = subprocess.run(
+        [sys.executable, "-m", "playwright", "install", "chromium"], check=False
+    )
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(install_browsers())
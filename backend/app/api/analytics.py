@@ -120,12 +120,12 @@ def analytics_user(
             """
             SELECT
                 COUNT(*)::int AS total_submissions,
-                COALESCE(SUM(CASE WHEN s.success = true THEN 1 ELSE 0 END), 0) AS successful_submissions,
-                COALESCE(SUM(CASE WHEN s.success = false THEN 1 ELSE 0 END), 0) AS failed_submissions,
-                COALESCE(SUM(CASE WHEN s.captcha_encountered = true THEN 1 ELSE 0 END), 0) AS captcha_submissions,
-                COALESCE(SUM(CASE WHEN s.captcha_solved = true THEN 1 ELSE 0 END), 0) AS captcha_solved,
+                COALESCE(COUNT(*) FILTER (WHERE s.success = true), 0) AS successful_submissions,
+                COALESCE(COUNT(*) FILTER (WHERE s.success = false), 0) AS failed_submissions,
+                COALESCE(COUNT(*) FILTER (WHERE s.captcha_encountered = true), 0) AS captcha_submissions,
+                COALESCE(COUNT(*) FILTER (WHERE s.captcha_solved = true), 0) AS captcha_solved,
                 COALESCE(AVG(s.retry_count), 0) AS avg_retry_count,
-                COALESCE(SUM(CASE WHEN s.email_extracted IS NOT NULL THEN 1 ELSE 0 END), 0) AS emails_extracted,
+                COALESCE(COUNT(*) FILTER (WHERE s.email_extracted IS NOT NULL), 0) AS emails_extracted,
                 COALESCE(COUNT(DISTINCT s.campaign_id), 0) AS unique_campaigns_used
             FROM submissions s
             WHERE s.user_id = :uid
@@ -475,10 +475,10 @@ def analytics_daily_stats(
             SELECT
                 CAST(date_trunc('day', s.created_at) AS date) AS day,
                 COUNT(*)::int AS total,
-                SUM(CASE WHEN s.success = true THEN 1 ELSE 0 END)::int AS success,
-                SUM(CASE WHEN s.success = false THEN 1 ELSE 0 END)::int AS failed,
-                SUM(CASE WHEN s.captcha_encountered = true THEN 1 ELSE 0 END)::int AS captcha_encountered,
-                SUM(CASE WHEN s.captcha_solved = true THEN 1 ELSE 0 END)::int AS captcha_solved,
+                (COUNT(*) FILTER (WHERE s.success = true))::int AS success,
+                (COUNT(*) FILTER (WHERE s.success = false))::int AS failed,
+                (COUNT(*) FILTER (WHERE s.captcha_encountered = true))::int AS captcha_encountered,
+                (COUNT(*) FILTER (WHERE s.captcha_solved = true))::int AS captcha_solved,
                 AVG(s.retry_count)::numeric(10,2) AS avg_retries,
                 COUNT(DISTINCT s.campaign_id)::int AS unique_campaigns,
                 COUNT(DISTINCT s.website_id)::int AS unique_websites
@@ -819,13 +819,13 @@ def analytics_performance(
             SELECT 
                 w.domain,
                 COUNT(s.id) as total_attempts,
-                SUM(CASE WHEN s.success = true THEN 1 ELSE 0 END) as successes,
-                SUM(CASE WHEN s.success = false THEN 1 ELSE 0 END) as failures,
+                COUNT(*) FILTER (WHERE s.success = true) as successes,
+                COUNT(*) FILTER (WHERE s.success = false) as failures,
                 ROUND(AVG(CASE WHEN s.retry_count IS NOT NULL THEN s.retry_count ELSE 0 END), 2) as avg_retries,
-                COUNT(CASE WHEN s.captcha_encountered = true THEN 1 END) as captcha_count,
-                COUNT(CASE WHEN s.captcha_solved = true THEN 1 END) as captcha_solved,
-                COUNT(CASE WHEN s.email_extracted IS NOT NULL THEN 1 END) as emails_found,
-                ROUND((SUM(CASE WHEN s.success = true THEN 1 ELSE 0 END)::float / COUNT(s.id)) * 100, 2) as success_rate,
+                COUNT(*) FILTER (WHERE s.captcha_encountered = true) as captcha_count,
+                COUNT(*) FILTER (WHERE s.captcha_solved = true) as captcha_solved,
+                COUNT(*) FILTER (WHERE s.email_extracted IS NOT NULL) as emails_found,
+                ROUND(((COUNT(*) FILTER (WHERE s.success = true))::float / COUNT(s.id)) * 100, 2) as success_rate,
                 MAX(s.created_at) as last_attempt
             FROM submissions s
             JOIN websites w ON s.website_id = w.id
@@ -1065,7 +1065,7 @@ def export_analytics_data(
                 COUNT(DISTINCT c.id) as campaigns_count,
                 COUNT(DISTINCT w.id) as websites_count,
                 COUNT(s.id) as total_submissions,
-                SUM(CASE WHEN s.success = true THEN 1 ELSE 0 END) as successful_submissions,
+                COUNT(*) FILTER (WHERE s.success = true) as successful_submissions,
                 AVG(CASE WHEN s.success = true THEN 100.0 ELSE 0.0 END) as success_rate
             FROM campaigns c
             LEFT JOIN websites w ON w.campaign_id = c.id AND w.user_id = c.user_id
@@ -9,6 +9,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,10 @@ from app.core.database import get_db
 from app.models import User  # package import
 from app.core.security import verify_password, hash_password, create_access_token
 from app.core.dependencies import get_current_user
+from app.services.auth_service import (
+    invalidate_cached_token,
+    invalidate_cached_user,
+)
 
 # --- Enhanced logging system ---
 from app.logging import get_logger
@@ -184,8 +189,8 @@ def register(payload: RegisterRequest, request: Request, db: Session = Depends(g
     )
 
     # Duplicate?
-    existing = db.query(User).filter(User.email == email).first()
-    if existing:
+    existing = db.scalar(select(User.id).where(User.email == email).limit(1))
+    if existing is not None:
         _log_auth_attempt(
             email=email,
             action="register",
@@ -198,27 +203,25 @@ def register(payload: RegisterRequest, request: Request, db: Session = Depends(g
             status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
         )
 
-    now = datetime.utcnow()
+    user_id = uuid.uuid4()
+    user_id_str = str(user_id)
     user = User(
-        id=uuid.uuid4(),
+        id=user_id,
         email=email,
         hashed_password=hash_password(payload.password),
         first_name=payload.first_name,
         last_name=payload.last_name,
         is_active=True,
         is_verified=False,
-        created_at=now,
-        updated_at=now,
     )
 
     try:
         db.add(user)
         db.commit()
-        db.refresh(user)
         logger.info(
             "User created successfully",
             context={
-                "user_id": str(user.id),
+                "user_id": user_id_str,
                 "email": email,
                 "event_type": "user_created",
             },
@@ -276,11 +279,11 @@ def register(payload: RegisterRequest, request: Request, db: Session = Depends(g
         action="register",
         success=True,
         ip_address=ip,
-        user_id=str(user.id),
+        user_id=user_id_str,
         db=db,
     )
     logger.performance_metric("jwt_generation_time", jwt_ms, unit="ms")
-    user_id_var.set(str(user.id))
+    user_id_var.set(user_id_str)
 
     return TokenResponse(access_token=token, user=_user_to_public_dict(user))
 
@@ -308,6 +311,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password"
         )
+    user_id_str = str(user.id)
 
     if not ALLOW_INACTIVE_LOGIN and not getattr(user, "is_active", True):
         _log_auth_attempt(
@@ -316,7 +320,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             success=False,
             ip_address=ip,
             failure_reason="inactive_user",
-            user_id=str(user.id),
+            user_id=user_id_str,
             db=db,
         )
         raise HTTPException(
@@ -330,7 +334,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             success=False,
             ip_address=ip,
             failure_reason="unverified_user",
-            user_id=str(user.id),
+            user_id=user_id_str,
             db=db,
         )
         raise HTTPException(
@@ -363,7 +367,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             success=False,
             ip_address=ip,
             failure_reason="invalid_password",
-            user_id=str(user.id),
+            user_id=user_id_str,
             db=db,
         )
         raise HTTPException(
@@ -387,7 +391,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
         action="login",
         success=True,
         ip_address=ip,
-        user_id=str(user.id),
+        user_id=user_id_str,
         db=db,
     )
     logger.performance_metric("jwt_generation_time", jwt_ms, unit="ms")
@@ -396,12 +400,12 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
         svc = _get_safe_logger(db)
         svc.track_business_event(
             event_name="user_logged_in",
-            properties={"user_id": str(user.id), "email": user.email},
+            properties={"user_id": user_id_str, "email": user.email},
         )
     except Exception:
         pass
 
-    user_id_var.set(str(user.id))
+    user_id_var.set(user_id_str)
     return TokenResponse(access_token=token, user=_user_to_public_dict(user))
 
 
@@ -491,6 +495,8 @@ def change_password(
     try:
         db.add(current_user)
         db.commit()
+        invalidate_cached_token(str(current_user.id), current_user.email)
+        invalidate_cached_user(current_user.email)
         logger.info(
             "Password changed successfully",
             context={"user_id": str(current_user.id), "event_type": "password_changed"},
@@ -549,6 +555,7 @@ def logout(
             "event_type": "logout",
         },
     )
+    invalidate_cached_token(str(current_user.id), current_user.email)
     try:
         svc = _get_safe_logger(db)
         svc.track_authentication(
@@ -7,7 +7,10 @@ from fastapi import (
     status,
     Request,
     Query,
+    Response,
 )
+from cachetools import TTLCache
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from uuid import UUID
@@ -27,6 +30,10 @@ from app.models.user import User
 
 router = APIRouter(prefix="/api/campaigns", tags=["campaigns"], redirect_slashes=False)
 
+# Serialized list entries keyed by (campaign id, updated_at); the short TTL
+# bounds how stale the derived submission stats can get.
+_resp_cache = TTLCache(maxsize=4096, ttl=30)
+
 
 def _safe_log(callable_):
     try:
@@ -40,11 +47,9 @@ def _ensure_owner(
 ) -> Campaign:
     try:
         query_start = time.time()
-        campaign = (
-            db.query(Campaign)
-            .filter(Campaign.id == campaign_id, Campaign.user_id == user.id)
-            .first()
-        )
+        campaign = db.get(Campaign, campaign_id)
+        if campaign and campaign.user_id != user.id:
+            campaign = None
         query_time = (time.time() - query_start) * 1000
 
         _safe_log(
@@ -76,7 +81,7 @@ def _ensure_owner(
         raise HTTPException(status_code=500, detail="Database error occurred")
 
 
-def _to_response(c: Campaign) -> CampaignResponse:
+def _to_response(c: Campaign, counts=None) -> CampaignResponse:
     """Convert Campaign model to response with enhanced data"""
     # Calculate additional stats
     total_submissions = 0
@@ -84,7 +89,12 @@ def _to_response(c: Campaign) -> CampaignResponse:
     failed_submissions = 0
     pending_submissions = 0
 
-    if hasattr(c, "submissions") and c.submissions:
+    if counts is not None:
+        total_submissions = counts.total
+        successful_submissions = counts.successful
+        failed_submissions = counts.failed
+        pending_submissions = counts.pending
+    elif hasattr(c, "submissions") and c.submissions:
         total_submissions = len(c.submissions)
         successful_submissions = sum(
             1 for s in c.submissions if s.status == SubmissionStatus.SUCCESS
@@ -132,6 +142,19 @@ def _to_response(c: Campaign) -> CampaignResponse:
     )
 
 
+def _cached_response_bytes(c: Campaign) -> bytes:
+    key = (c.id, c.updated_at)
+    data = _resp_cache.get(key)
+    if data is None:
+        data = _to_response(c).model_dump_json().encode()
+        _resp_cache[key] = data
+    return data
+
+
+def _drop_cached_response(c: Campaign) -> None:
+    _resp_cache.pop((c.id, c.updated_at), None)
+
+
 @router.post("", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 def create_campaign(
     payload: CampaignCreate,
@@ -195,14 +218,11 @@ def create_campaign(
             name=campaign_name,
             message=campaign_message,
             status=CampaignStatus.DRAFT,  # Use enum
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
         )
 
         db_start = time.time()
         db.add(campaign)
         db.commit()
-        db.refresh(campaign)
         db_time = (time.time() - db_start) * 1000
 
         _safe_log(lambda: logger.set_context(campaign_id=str(campaign.id)))
@@ -303,7 +323,11 @@ def list_campaigns(
 
         # Apply pagination
         offset = (page - 1) * eff_limit
-        rows = q.offset(offset).limit(eff_limit).all()
+        # Serialize rows as they come off the cursor instead of after .all()
+        parts = [
+            _cached_response_bytes(c)
+            for c in q.offset(offset).limit(eff_limit).yield_per(100)
+        ]
 
         query_time = (time.time() - query_start) * 1000
 
@@ -312,14 +336,14 @@ def list_campaigns(
                 operation="SELECT",
                 table="campaigns",
                 query_time_ms=query_time,
-                affected_rows=len(rows),
+                affected_rows=len(parts),
                 success=True,
             )
         )
         _safe_log(
             lambda: logger.track_metric(
                 name="campaigns_retrieved",
-                value=len(rows),
+                value=len(parts),
                 properties={
                     "user_id": str(user.id),
                     "total_available": total_count,
@@ -329,7 +353,8 @@ def list_campaigns(
             )
         )
 
-        return [_to_response(c) for c in rows]
+        body = b"[" + b",".join(parts) + b"]"
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
@@ -362,14 +387,31 @@ def get_campaign(
     )
 
     try:
-        campaign = _ensure_owner(db, user, campaign_id, logger)
-
-        # Load related submissions for enhanced statistics
-        campaign.submissions = (
-            db.query(Submission).filter(Submission.campaign_id == campaign_id).all()
+        # Campaign and its submission counts in one round-trip
+        row = (
+            db.query(
+                Campaign,
+                func.count(Submission.id).label("total"),
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.SUCCESS)
+                .label("successful"),
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.FAILED)
+                .label("failed"),
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.PENDING)
+                .label("pending"),
+            )
+            .outerjoin(Submission, Submission.campaign_id == Campaign.id)
+            .filter(Campaign.id == campaign_id, Campaign.user_id == user.id)
+            .group_by(Campaign.id)
+            .first()
         )
 
-        return _to_response(campaign)
+        if not row:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        return _to_response(row.Campaign, counts=row)
 
     except HTTPException:
         raise
@@ -459,12 +501,12 @@ def update_campaign(
                 campaign.message = new_message
 
         if changes:
+            _drop_cached_response(campaign)
             campaign.updated_at = datetime.utcnow()
 
             db_start = time.time()
             db.add(campaign)
             db.commit()
-            db.refresh(campaign)
             db_time = (time.time() - db_start) * 1000
 
             _safe_log(
@@ -548,17 +590,17 @@ def delete_campaign(
                 detail="Cannot delete a running campaign. Please stop the campaign first.",
             )
 
-        # Get submission count for logging
-        submission_count = (
-            db.query(Submission).filter(Submission.campaign_id == campaign_id).count()
-        )
-
         db_start = time.time()
 
-        # Delete related submissions first (cascading delete)
-        db.query(Submission).filter(Submission.campaign_id == campaign_id).delete()
+        # Delete related submissions first; the rowcount doubles as the log count
+        submission_count = (
+            db.query(Submission)
+            .filter(Submission.campaign_id == campaign_id)
+            .delete(synchronize_session=False)
+        )
 
         # Delete the campaign
+        _drop_cached_response(campaign)
         db.delete(campaign)
         db.commit()
 
@@ -649,6 +691,7 @@ def start_campaign(
             )
 
         # Update campaign status
+        _drop_cached_response(campaign)
         campaign.status = CampaignStatus.ACTIVE
         campaign.started_at = datetime.utcnow()
         campaign.updated_at = datetime.utcnow()
@@ -726,6 +769,7 @@ def stop_campaign(
             )
 
         # Update campaign status to paused
+        _drop_cached_response(campaign)
         campaign.status = CampaignStatus.PAUSED
         campaign.updated_at = datetime.utcnow()
 
@@ -54,15 +54,7 @@ async def start_campaign_processing(
         if not file.filename.endswith(".csv"):
             raise HTTPException(status_code=400, detail="File must be CSV")
 
-        # Parse CSV
         content = await file.read()
-        urls, errors, headers = await CSVParserService.parse_csv_file(content)
-
-        if not urls:
-            error_msg = f"No URLs found. Headers detected: {headers}"
-            if errors:
-                error_msg += f". Errors: {errors[:5]}"
-            raise HTTPException(status_code=400, detail=error_msg)
 
         # Create campaign
         campaign = Campaign(
@@ -77,16 +69,30 @@ async def start_campaign_processing(
         db.add(campaign)
         db.flush()
 
-        # Create submissions
+        # Parse the CSV and create submissions one batch at a time
+        errors = []
+        headers = []
         service = SubmissionService(db)
-        submissions, submission_errors = service.bulk_create_submissions(
-            user_id=current_user.id, campaign_id=campaign.id, urls=urls
+        (
+            created_count,
+            url_count,
+            submission_errors,
+        ) = await service.bulk_create_submissions_stream(
+            user_id=current_user.id,
+            campaign_id=campaign.id,
+            url_batches=CSVParserService.parse_csv_stream(content, errors, headers),
         )
 
+        if not url_count:
+            db.rollback()
+            error_msg = f"No URLs found. Headers detected: {headers}"
+            if errors:
+                error_msg += f". Errors: {errors[:5]}"
+            raise HTTPException(status_code=400, detail=error_msg)
+
         # Update campaign
-        campaign.total_urls = len(submissions)
+        campaign.total_urls = created_count
         db.commit()
-        db.refresh(campaign)
 
         # Start background processing with Windows compatibility
         campaign_id_str = str(campaign.id)
@@ -115,10 +121,10 @@ async def start_campaign_processing(
         return {
             "success": True,
             "campaign_id": campaign_id_str,
-            "total_urls": len(urls),
-            "created_submissions": len(submissions),
+            "total_urls": url_count,
+            "created_submissions": created_count,
             "errors": errors + submission_errors,
-            "message": f"Campaign started with {len(submissions)} URLs",
+            "message": f"Campaign started with {created_count} URLs",
         }
 
     except HTTPException:
@@ -142,15 +148,7 @@ async def start_campaign_processing_windows(
         if not file.filename.endswith(".csv"):
             raise HTTPException(status_code=400, detail="File must be CSV")
 
-        # Parse CSV
         content = await file.read()
-        urls, errors, headers = await CSVParserService.parse_csv_file(content)
-
-        if not urls:
-            error_msg = f"No URLs found. Headers detected: {headers}"
-            if errors:
-                error_msg += f". Errors: {errors[:5]}"
-            raise HTTPException(status_code=400, detail=error_msg)
 
         # Create campaign
         campaign = Campaign(
@@ -165,16 +163,30 @@ async def start_campaign_processing_windows(
         db.add(campaign)
         db.flush()
 
-        # Create submissions
+        # Parse the CSV and create submissions one batch at a time
+        errors = []
+        headers = []
         service = SubmissionService(db)
-        submissions, submission_errors = service.bulk_create_submissions(
-            user_id=current_user.id, campaign_id=campaign.id, urls=urls
+        (
+            created_count,
+            url_count,
+            submission_errors,
+        ) = await service.bulk_create_submissions_stream(
+            user_id=current_user.id,
+            campaign_id=campaign.id,
+            url_batches=CSVParserService.parse_csv_stream(content, errors, headers),
         )
 
+        if not url_count:
+            db.rollback()
+            error_msg = f"No URLs found. Headers detected: {headers}"
+            if errors:
+                error_msg += f". Errors: {errors[:5]}"
+            raise HTTPException(status_code=400, detail=error_msg)
+
         # Update campaign
-        campaign.total_urls = len(submissions)
+        campaign.total_urls = created_count
         db.commit()
-        db.refresh(campaign)
 
         # Use subprocess runner specifically designed for Windows
         from app.workers.subprocess_runner import run_campaign_in_subprocess
@@ -192,10 +204,10 @@ async def start_campaign_processing_windows(
         return {
             "success": True,
             "campaign_id": campaign_id_str,
-            "total_urls": len(urls),
-            "created_submissions": len(submissions),
+            "total_urls": url_count,
+            "created_submissions": created_count,
             "errors": errors + submission_errors,
-            "message": f"Campaign started with {len(submissions)} URLs (Windows mode)",
+            "message": f"Campaign started with {created_count} URLs (Windows mode)",
             "processing_mode": "windows_subprocess",
         }
 
@@ -284,7 +296,6 @@ async def get_campaign_status(
             campaign.status = CampaignStatus.COMPLETED
             campaign.completed_at = datetime.utcnow()
             db.commit()
-            db.refresh(campaign)
             is_complete = True
 
         return {
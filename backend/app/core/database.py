@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -9,18 +10,54 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+_url = make_url(settings.DATABASE_URL)
+
+# psycopg2-only tuning: batch plain executemany (bulk UPDATE/INSERT without
+# RETURNING) too; other drivers reject the option
+_driver_kwargs = (
+    {"executemany_mode": "values_plus_batch"}
+    if _url.get_driver_name() == "psycopg2"
+    else {}
+)
+
 # Create database engine
 engine = create_engine(
-    settings.DATABASE_URL,
+    _url,
+    # Sized for campaign workers sharing the pool with API requests; past a
+    # few dozen concurrent workers put PgBouncer (session mode) in front
+    # rather than raising these, as each Postgres backend costs ~10MB.
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    # Long-running workers outlive server/proxy idle cut-offs; ping on
+    # checkout so a dropped connection is replaced instead of failing a write.
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=1800,
+    # Cap each multi-row INSERT ... VALUES at 1000 rows
+    insertmanyvalues_page_size=1000,
     echo=settings.DEBUG,
+    **_driver_kwargs,
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sessions for campaign workers: no statement may hang a worker indefinitely.
+# The timeout is SET LOCAL per transaction, so pooled connections handed to
+# API requests afterwards are unaffected.
+WorkerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+WORKER_STATEMENT_TIMEOUT_MS = 60000
+
+
+@event.listens_for(WorkerSessionLocal, "after_begin")
+def _set_worker_statement_timeout(session, transaction, connection):
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {WORKER_STATEMENT_TIMEOUT_MS}"
+        )
+
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -30,7 +67,9 @@ def get_db() -> Generator[Session, None, None]:
     Dependency to get database session.
     Ensures proper cleanup after use.
     """
-    db = SessionLocal()
+    # Request sessions end right after the response is built; keeping loaded
+    # attributes across commit avoids a re-SELECT on every post-write access.
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -1,5 +1,6 @@
 # app/core/encryption.py
 import base64
+from typing import List
 from cryptography.fernet import Fernet
 from app.core.config import get_settings
 
@@ -18,6 +19,10 @@ class EncryptionService:
     def encrypt(self, data: str) -> str:
         return self.cipher.encrypt(data.encode()).decode()
 
+    def encrypt_many(self, values: List[str]) -> List[str]:
+        encrypt = self.cipher.encrypt
+        return [encrypt(v.encode()).decode() for v in values]
+
     def decrypt(self, encrypted_data: str) -> str:
         return self.cipher.decrypt(encrypted_data.encode()).decode()
 
@@ -1,7 +1,13 @@
 # app/core/security.py
+from base64 import urlsafe_b64encode
+from calendar import timegm
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import jwt
+import hashlib
+import hmac
+import json
 from passlib.context import CryptContext
 from passlib.hash import bcrypt
 import secrets
@@ -29,6 +35,28 @@ def hash_password(password: str) -> str:
         return bcrypt.hash(password)
 
 
+def _b64url(raw: bytes) -> bytes:
+    return urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# Same compact, sorted header python-jose emits for HS256
+_HS256_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+@lru_cache(maxsize=4)
+def _hmac_template(secret: str) -> "hmac.HMAC":
+    """Keyed HMAC-SHA256 state; copying it skips key setup on every sign."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _sign_hs256(claims: dict, secret: str) -> str:
+    payload = _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = _HS256_HEADER + b"." + payload
+    mac = _hmac_template(secret).copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     from app.core.config import get_settings
 
@@ -37,6 +65,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     expire = datetime.utcnow() + (
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
+    if settings.ALGORITHM == "HS256":
+        to_encode["exp"] = timegm(expire.utctimetuple())
+        return _sign_hs256(to_encode, settings.SECRET_KEY)
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
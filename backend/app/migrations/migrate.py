@@ -5,14 +5,92 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from alembic import command
 from alembic.config import Config
+from sqlalchemy import text
 from app.core.database import engine
-from app.models import Base
+import app.models  # noqa: F401  (registers every model on Base)
+from app.models.base import Base
+
+
+# create_all never alters existing tables, so constraints added to models
+# later are applied here. Every statement is safe to re-run.
+USER_PROFILE_UNIQUE_USER_ID = [
+    # Keep only the most recently updated profile per user
+    """
+    DELETE FROM user_profiles p
+    USING user_profiles newer
+    WHERE p.user_id = newer.user_id
+      AND (COALESCE(p.updated_at, p.created_at, 'epoch'::timestamp), p.id)
+        < (COALESCE(newer.updated_at, newer.created_at, 'epoch'::timestamp), newer.id)
+    """,
+    # Same name as the index behind create_all's unique=True constraint, so
+    # tables that already have it are skipped
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS user_profiles_user_id_key
+    ON user_profiles (user_id)
+    """,
+]
+
+
+# Case-insensitive uniqueness for users.email. Lookups match the stored,
+# already lowercased value, so this guards writes rather than serving reads.
+USERS_EMAIL_LOWER_UNIQUE = [
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower
+    ON users (lower(email))
+    """,
+]
+
+# Matches the GROUP BY date(created_at) used by daily analytics
+SUBMISSIONS_DAILY_STATS_INDEX = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_submissions_created_date_status
+    ON submissions (date(created_at), status)
+    """,
+]
+
+# Per-user and per-campaign submission listings ordered newest first
+SUBMISSIONS_LISTING_INDEXES = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_submissions_user_created
+    ON submissions (user_id, created_at DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_submissions_campaign_status_created
+    ON submissions (campaign_id, status, created_at DESC)
+    """,
+]
+
+# Keyset pagination of a campaign's websites, newest first, NULL dates last
+WEBSITES_KEYSET_INDEX = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_websites_campaign_created_id
+    ON websites (campaign_id, created_at DESC NULLS LAST, id DESC)
+    """,
+]
+
+UPGRADES = [
+    USER_PROFILE_UNIQUE_USER_ID,
+    USERS_EMAIL_LOWER_UNIQUE,
+    SUBMISSIONS_DAILY_STATS_INDEX,
+    SUBMISSIONS_LISTING_INDEXES,
+    WEBSITES_KEYSET_INDEX,
+]
+
+
+def upgrade_existing_tables(connection):
+    """Apply model constraints that create_all cannot add to existing tables"""
+    for statements in UPGRADES:
+        for statement in statements:
+            connection.execute(text(statement))
 
 
 def run_migrations():
     """Run database migrations"""
     # Create all tables
     Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        upgrade_existing_tables(connection)
     print("✅ Database migrations completed")
 
 
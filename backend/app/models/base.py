@@ -2,12 +2,17 @@
 # FILE: app/models/base.py
 # ============================================
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, func
 from datetime import datetime
 
 Base = declarative_base()
 
 
+def utc_now():
+    """Database-side UTC timestamp, matching the naive-UTC DateTime columns."""
+    return func.timezone("utc", func.now())
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps"""
 
@@ -19,7 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, utc_now
 
 
 class CampaignStatus(str, enum.Enum):
@@ -34,6 +34,7 @@ class CampaignStatus(str, enum.Enum):
 
 class Campaign(Base):
     __tablename__ = "campaigns"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -68,8 +69,17 @@ class Campaign(Base):
     no_form = Column(Integer, nullable=True, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=True, onupdate=datetime.utcnow)
+    # Python defaults cover existing tables, which create_all never alters
+    created_at = Column(
+        DateTime, nullable=True, default=datetime.utcnow, server_default=utc_now()
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
+    )
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
@@ -4,7 +4,17 @@ from __future__ import annotations
 import uuid
 import enum
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import (
+    Column,
+    String,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Text,
+    Index,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -71,3 +81,24 @@ class Submission(Base):
 
     def __repr__(self):
         return f"<Submission {self.url}>"
+
+
+# Matches the GROUP BY date(created_at) used by daily analytics
+Index(
+    "ix_submissions_created_date_status",
+    func.date(Submission.created_at),
+    Submission.status,
+)
+
+# Per-user and per-campaign listings ordered newest first
+Index(
+    "ix_submissions_user_created",
+    Submission.user_id,
+    Submission.created_at.desc(),
+)
+Index(
+    "ix_submissions_campaign_status_created",
+    Submission.campaign_id,
+    Submission.status,
+    Submission.created_at.desc(),
+)
@@ -5,15 +5,25 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    Boolean,
+    DateTime,
+    Text,
+    ForeignKey,
+    Index,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, utc_now
 
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -45,8 +55,17 @@ class User(Base):
     captcha_password_hash = Column(Text, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=True, onupdate=datetime.utcnow)
+    # Python defaults cover existing tables, which create_all never alters
+    created_at = Column(
+        DateTime, nullable=True, default=datetime.utcnow, server_default=utc_now()
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
+    )
 
     # Relationships
     campaigns = relationship(
@@ -71,4 +90,8 @@ class User(Base):
     def full_name(self):
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
-        return self.first_name or self.last_name or self.email.split("@")[0]
\ No newline at end of file
+        return self.first_name or self.last_name or self.email.split("@")[0]
+
+
+# Emails are stored lowercased; this keeps them unique case-insensitively
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -19,7 +19,10 @@ class UserProfile(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Foreign key
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    # Unique: one profile per user, and the conflict target for profile upserts
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, unique=True
+    )
 
     # Basic contact information
     first_name = Column(String(100), nullable=True)
@@ -14,15 +14,17 @@ from sqlalchemy import (
     Integer,
     Text,
     ARRAY,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, utc_now
 
 
 class Website(Base):
     __tablename__ = "websites"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -61,8 +63,14 @@ class Website(Base):
 
     # Timestamps
     created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
+    # Stamped on insert and on every UPDATE, ORM or bulk. The Python default
+    # covers existing tables, which create_all never gives the server default.
     updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
     )
 
     # Relationships
@@ -74,3 +82,12 @@ class Website(Base):
 
     def __repr__(self):
         return f"<Website {self.domain}>"
+
+
+# Keyset pagination of a campaign's websites, newest first, NULL dates last
+Index(
+    "ix_websites_campaign_created_id",
+    Website.campaign_id,
+    Website.created_at.desc().nulls_last(),
+    Website.id.desc(),
+)
@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List, Literal, Union
 from datetime import datetime, date
+from uuid import UUID
 
 
 class SubmissionStats(BaseModel):
@@ -22,7 +23,7 @@ class SubmissionStats(BaseModel):
 class CampaignAnalytics(BaseModel):
     """Schema for campaign analytics"""
 
-    campaign_id: str
+    campaign_id: UUID
     campaign_name: str
     status: str
     total_urls: int = 0
@@ -2,6 +2,26 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
+from enum import Enum
+
+
+class WebsiteStatus(str, Enum):
+    """Website processing status"""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class CaptchaDifficulty(str, Enum):
+    """Captcha difficulty levels"""
+
+    EASY = "easy"
+    MEDIUM = "medium"
+    HARD = "hard"
+    VERY_HARD = "very_hard"
 
 
 class WebsiteCreate(BaseModel):
@@ -27,6 +47,9 @@ class WebsiteCreate(BaseModel):
             return f"https://{v}"
         return v
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteUpdate(BaseModel):
     """Schema for updating a website"""
@@ -40,14 +63,12 @@ class WebsiteUpdate(BaseModel):
     has_captcha: Optional[bool] = None
     captcha_type: Optional[str] = Field(None, max_length=100)
     form_name_variants: Optional[List[str]] = None
-    status: Optional[
-        Literal["pending", "processing", "completed", "failed", "skipped"]
-    ] = None
+    status: Optional[WebsiteStatus] = None
     failure_reason: Optional[str] = None
     requires_proxy: Optional[bool] = None
     proxy_block_type: Optional[str] = None
     last_proxy_used: Optional[str] = None
-    captcha_difficulty: Optional[Literal["easy", "medium", "hard", "very_hard"]] = None
+    captcha_difficulty: Optional[CaptchaDifficulty] = None
     captcha_solution_time: Optional[int] = Field(None, ge=0)
     captcha_metadata: Optional[Dict[str, Any]] = None
     form_field_types: Optional[Dict[str, Any]] = None
@@ -66,6 +87,10 @@ class WebsiteUpdate(BaseModel):
             raise ValueError("Captcha solution time cannot be negative")
         return v
 
+    class Config:
+        use_enum_values = True
+        defer_build = True
+
 
 class WebsiteResponse(BaseModel):
     """Schema for website response"""
@@ -98,6 +123,8 @@ class WebsiteResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        defer_build = True
 
 
 class WebsiteList(BaseModel):
@@ -108,6 +135,9 @@ class WebsiteList(BaseModel):
     page: int = 1
     per_page: int = 10
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteStats(BaseModel):
     """Schema for website statistics"""
@@ -122,14 +152,15 @@ class WebsiteStats(BaseModel):
     captcha_encounter_rate: float = 0.0
     success_rate: float = 0.0
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteFilter(BaseModel):
     """Schema for filtering websites"""
 
     campaign_id: Optional[str] = None
-    status: Optional[
-        Literal["pending", "processing", "completed", "failed", "skipped"]
-    ] = None
+    status: Optional[WebsiteStatus] = None
     form_detected: Optional[bool] = None
     has_captcha: Optional[bool] = None
     requires_proxy: Optional[bool] = None
@@ -137,6 +168,10 @@ class WebsiteFilter(BaseModel):
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
 
+    class Config:
+        use_enum_values = True
+        defer_build = True
+
 
 class WebsiteAnalysis(BaseModel):
     """Schema for website analysis results"""
@@ -152,6 +187,9 @@ class WebsiteAnalysis(BaseModel):
     analyzed_at: Optional[datetime] = None
     analysis_duration_ms: Optional[int] = None
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteBulkUpdate(BaseModel):
     """Schema for bulk website updates"""
@@ -161,10 +199,18 @@ class WebsiteBulkUpdate(BaseModel):
 
     @validator("website_ids")
     def validate_ids(cls, v):
-        if len(v) != len(set(v)):
-            raise ValueError("Duplicate website IDs found")
+        # Single pass, bail out on the first duplicate
+        seen = set()
+        add = seen.add
+        for website_id in v:
+            if website_id in seen:
+                raise ValueError("Duplicate website IDs found")
+            add(website_id)
         return v
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteImport(BaseModel):
     """Schema for importing websites"""
@@ -176,6 +222,9 @@ class WebsiteImport(BaseModel):
     skip_duplicates: bool = True
     validate_domains: bool = True
 
+    class Config:
+        defer_build = True
+
 
 class WebsiteExport(BaseModel):
     """Schema for exporting websites"""
@@ -184,3 +233,21 @@ class WebsiteExport(BaseModel):
     filters: Optional[WebsiteFilter] = None
     fields: Optional[List[str]] = None
     include_analysis_data: bool = False
+
+    class Config:
+        defer_build = True
+
+
+# Website schemas are built lazily (defer_build) and compiled once at startup
+WEBSITE_SCHEMAS = (
+    WebsiteCreate,
+    WebsiteUpdate,
+    WebsiteResponse,
+    WebsiteList,
+    WebsiteStats,
+    WebsiteFilter,
+    WebsiteAnalysis,
+    WebsiteBulkUpdate,
+    WebsiteImport,
+    WebsiteExport,
+)
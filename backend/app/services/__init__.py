@@ -2,48 +2,34 @@
 Services module for Contact Page Submitter application.
 """
 
-# Import services with proper error handling
-try:
-    from .auth_service import AuthService
-except ImportError as e:
-    print(f"Warning: Could not import AuthService: {e}")
-    AuthService = None
+import importlib
+
+# Services are imported lazily on first attribute access (PEP 562) so that
+# importing one light service does not drag in Playwright, HTTP clients, etc.
+_LAZY = {
+    "AuthService": ".auth_service",
+    "BrowserAutomationService": ".browser_automation_service",
+    "BrowserService": ".browser_service",
+    "CampaignService": ".campaign_service",
+    "CaptchaService": ".captcha_service",
+    "FormService": ".form_service",
+    "LogService": ".log_service",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        # Import services with proper error handling
+        try:
+            mod = importlib.import_module(_LAZY[name], __name__)
+            cls = getattr(mod, name)
+        except ImportError as e:
+            print(f"Warning: Could not import {name}: {e}")
+            cls = None
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from .browser_automation_service import BrowserAutomationService
-except ImportError as e:
-    print(f"Warning: Could not import BrowserAutomationService: {e}")
-    BrowserAutomationService = None
-
-try:
-    from .browser_service import BrowserService
-except ImportError as e:
-    print(f"Warning: Could not import BrowserService: {e}")
-    BrowserService = None
-
-try:
-    from .campaign_service import CampaignService
-except ImportError as e:
-    print(f"Warning: Could not import CampaignService: {e}")
-    CampaignService = None
-
-try:
-    from .captcha_service import CaptchaService
-except ImportError as e:
-    print(f"Warning: Could not import CaptchaService: {e}")
-    CaptchaService = None
-
-try:
-    from .form_service import FormService
-except ImportError as e:
-    print(f"Warning: Could not import FormService: {e}")
-    FormService = None
-
-try:
-    from .log_service import LogService
-except ImportError as e:
-    print(f"Warning: Could not import LogService: {e}")
-    LogService = None
 
 # Export all available services
 __all__ = [
@@ -9,6 +9,7 @@ from app.models.user import User
 from app.models.campaign import Campaign
 from app.models.submission import Submission
 from app.models.logs import SystemLog  # Fixed import - now from logs module
+from app.services.auth_service import invalidate_cached_token, invalidate_cached_user
 from app.schemas.admin import (
     SystemStatus,
     UserManagement,
@@ -71,7 +72,12 @@ class AdminService:
     def manage_user(
         self, admin_user_id: uuid.UUID, user_management: UserManagement
     ) -> AdminResponse:
-        """Perform user management actions"""
+        """Perform user management actions
+
+        Every action drops the target's cached login snapshot and token once
+        committed. Those caches are per-process, so other workers keep serving
+        the old snapshot until its TTL (30s) runs out.
+        """
         # Verify admin permissions
         admin_user = self.db.query(User).filter(User.id == admin_user_id).first()
         if not admin_user or admin_user.role not in ["admin", "owner"]:
@@ -119,6 +125,8 @@ class AdminService:
         )
 
         self.db.commit()
+        invalidate_cached_user(target_user.email)
+        invalidate_cached_token(str(target_user.id), target_user.email)
 
         return AdminResponse(
             success=True,
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import func, desc, and_, cast, Float, Numeric
 from fastapi import HTTPException
 
 from app.models.user import User
@@ -46,10 +46,20 @@ class AnalyticsService:
 
             total_campaigns = query.count()
 
-            # Get submission stats for this user with proper enum handling
-            submission_query = self.db.query(Submission).filter(
-                Submission.user_id == user_id
-            )
+            # Get submission stats for this user in a single aggregate query
+            submission_query = self.db.query(
+                func.count(Submission.id).label("total"),
+                # FIXED: Use proper enum values instead of strings
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.SUCCESS)
+                .label("successful"),
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.FAILED)
+                .label("failed"),
+                func.count(Submission.id)
+                .filter(Submission.status == SubmissionStatus.PENDING)
+                .label("pending"),
+            ).filter(Submission.user_id == user_id)
 
             if start_date:
                 submission_query = submission_query.filter(
@@ -60,22 +70,11 @@ class AnalyticsService:
                     Submission.created_at <= end_date
                 )
 
-            total_submissions = submission_query.count()
-
-            # FIXED: Use proper enum values instead of strings
-            successful_submissions = submission_query.filter(
-                Submission.status.in_(
-                    [SubmissionStatus.SUCCESS, SubmissionStatus.COMPLETED]
-                )
-            ).count()
-
-            failed_submissions = submission_query.filter(
-                Submission.status == SubmissionStatus.FAILED
-            ).count()
-
-            pending_submissions = submission_query.filter(
-                Submission.status == SubmissionStatus.PENDING
-            ).count()
+            counts = submission_query.one()
+            total_submissions = counts.total
+            successful_submissions = counts.successful
+            failed_submissions = counts.failed
+            pending_submissions = counts.pending
 
             success_rate = (
                 (successful_submissions / total_submissions * 100)
@@ -146,7 +145,7 @@ class AnalyticsService:
             successful = sum(
                 count
                 for status, count in submission_counts
-                if status in [SubmissionStatus.SUCCESS, SubmissionStatus.COMPLETED]
+                if status == SubmissionStatus.SUCCESS
             )
 
             failed = sum(
@@ -197,7 +196,7 @@ class AnalyticsService:
             )
 
             return CampaignAnalytics(
-                campaign_id=str(campaign_id),
+                campaign_id=campaign_id,
                 campaign_name=campaign.name or "Unnamed Campaign",
                 total_urls=total_urls,
                 submitted_count=submitted_count,
@@ -232,11 +231,7 @@ class AnalyticsService:
 
             successful_submissions = (
                 self.db.query(Submission)
-                .filter(
-                    Submission.status.in_(
-                        [SubmissionStatus.SUCCESS, SubmissionStatus.COMPLETED]
-                    )
-                )
+                .filter(Submission.status == SubmissionStatus.SUCCESS)
                 .count()
             )
 
@@ -266,46 +261,49 @@ class AnalyticsService:
                 success_rate=round(success_rate, 2),
             )
 
-            # Get top performing campaigns with safe attribute access
+            # Get top performing campaigns; success_rate is computed and
+            # sorted by the database so rows map straight onto the schema
+            success_rate = func.coalesce(
+                cast(
+                    func.round(
+                        cast(
+                            Campaign.submitted_count
+                            * 100.0
+                            / func.nullif(Campaign.total_urls, 0),
+                            Numeric,
+                        ),
+                        2,
+                    ),
+                    Float,
+                ),
+                0,
+            )
             top_campaigns_query = (
-                self.db.query(Campaign)
+                self.db.query(
+                    Campaign.id.label("campaign_id"),
+                    func.coalesce(Campaign.name, "Unnamed Campaign").label(
+                        "campaign_name"
+                    ),
+                    Campaign.status.label("status"),
+                    func.coalesce(Campaign.total_urls, 0).label("total_urls"),
+                    func.coalesce(Campaign.submitted_count, 0).label("submitted_count"),
+                    func.coalesce(
+                        func.nullif(Campaign.failed_count, 0), Campaign.failed, 0
+                    ).label("failed_count"),
+                    success_rate.label("success_rate"),
+                )
                 .filter(Campaign.total_urls > 0)
-                .order_by(desc(Campaign.submitted_count))
+                .order_by(desc("success_rate"))
                 .limit(5)
             )
 
-            top_performing_campaigns = []
-            for campaign in top_campaigns_query.all():
-                try:
-                    total_urls = getattr(campaign, "total_urls", 0) or 0
-                    submitted_count = getattr(campaign, "submitted_count", 0) or 0
-                    failed_count = (
-                        getattr(campaign, "failed_count", 0)
-                        or getattr(campaign, "failed", 0)
-                        or 0
-                    )
-
-                    success_rate = (
-                        (submitted_count / total_urls * 100) if total_urls > 0 else 0
-                    )
-
-                    top_performing_campaigns.append(
-                        CampaignAnalytics(
-                            campaign_id=str(campaign.id),
-                            campaign_name=campaign.name or "Unnamed Campaign",
-                            total_urls=total_urls,
-                            submitted_count=submitted_count,
-                            failed_count=failed_count,
-                            success_rate=round(success_rate, 2),
-                            captcha_encounters=0,  # Would need separate query
-                            captcha_solve_rate=0,  # Would need separate query
-                        )
-                    )
-                except Exception as campaign_error:
-                    print(
-                        f"[ANALYTICS SERVICE] ⚠️ Error processing campaign {campaign.id}: {campaign_error}"
-                    )
-                    continue
+            top_performing_campaigns = [
+                # Validated like any other response; status goes out as its value
+                CampaignAnalytics.model_validate(
+                    {**row._mapping, "status": row.status.value}
+                )
+                for row in top_campaigns_query.all()
+            ]
 
             return SystemAnalytics(
                 total_users=total_users,
@@ -345,30 +343,26 @@ class AnalyticsService:
             start_date = end_date - timedelta(days=days)
 
             # FIXED: Use proper enum values in aggregation
+            total = func.count(Submission.id)
+            successful = func.count(Submission.id).filter(
+                Submission.status == SubmissionStatus.SUCCESS
+            )
+            failed = func.count(Submission.id).filter(
+                Submission.status == SubmissionStatus.FAILED
+            )
+
+            # success_rate is computed by the database so rows arrive final
             query = self.db.query(
                 func.date(Submission.created_at).label("date"),
-                func.count(Submission.id).label("total"),
-                func.sum(
-                    func.case(
-                        [
-                            (
-                                Submission.status.in_(
-                                    [
-                                        SubmissionStatus.SUCCESS,
-                                        SubmissionStatus.COMPLETED,
-                                    ]
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("successful"),
-                func.sum(
-                    func.case(
-                        [(Submission.status == SubmissionStatus.FAILED, 1)], else_=0
-                    )
-                ).label("failed"),
+                total.label("total"),
+                successful.label("successful"),
+                failed.label("failed"),
+                func.coalesce(
+                    func.round(
+                        cast(successful * 100.0 / func.nullif(total, 0), Numeric), 2
+                    ),
+                    0,
+                ).label("success_rate"),
             ).filter(func.date(Submission.created_at) >= start_date)
 
             if user_id:
@@ -376,29 +370,20 @@ class AnalyticsService:
             if campaign_id:
                 query = query.filter(Submission.campaign_id == campaign_id)
 
-            results = (
-                query.group_by(func.date(Submission.created_at))
-                .order_by(func.date(Submission.created_at))
-                .all()
+            query = query.group_by(func.date(Submission.created_at)).order_by(
+                func.date(Submission.created_at)
             )
 
-            daily_stats = []
-            for result in results:
-                successful = result.successful or 0
-                total = result.total or 0
-                failed = result.failed or 0
-
-                daily_stats.append(
-                    {
-                        "date": str(result.date),
-                        "total": total,
-                        "successful": successful,
-                        "failed": failed,
-                        "success_rate": round(
-                            (successful / total * 100) if total > 0 else 0, 2
-                        ),
-                    }
-                )
+            daily_stats = [
+                {
+                    "date": str(result.date),
+                    "total": result.total,
+                    "successful": result.successful,
+                    "failed": result.failed,
+                    "success_rate": float(result.success_rate),
+                }
+                for result in query.yield_per(100)
+            ]
 
             print(f"[ANALYTICS SERVICE] 📈 Generated {len(daily_stats)} daily stats")
             return daily_stats
@@ -2,78 +2,188 @@
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
 import uuid
-import traceback
 
 from app.core.security import hash_password, verify_password, create_access_token
 from app.models.user import User
 from app.schemas.auth import UserLogin, UserRegister, AuthResponse, UserResponse
 
+logger = logging.getLogger(__name__)
+
+# bcrypt is deliberately slow; the async login/register paths run it in
+# worker processes so hashes spread across cores and never contend with the
+# event loop for the GIL. Started on first use with "spawn", since forking a
+# multithreaded server can copy held locks into the children.
+_bcrypt_pool: Optional[ProcessPoolExecutor] = None
+_bcrypt_pool_lock = threading.Lock()
+
+
+def get_bcrypt_pool() -> ProcessPoolExecutor:
+    """Return the bcrypt process pool, starting it on first use."""
+    global _bcrypt_pool
+    with _bcrypt_pool_lock:
+        if _bcrypt_pool is None:
+            _bcrypt_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _bcrypt_pool
+
+
+def shutdown_bcrypt_pool() -> None:
+    """Stop the bcrypt worker processes (application shutdown)."""
+    global _bcrypt_pool
+    with _bcrypt_pool_lock:
+        pool, _bcrypt_pool = _bcrypt_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Signed access tokens keyed by user; TTL stays well below the JWT expiry so
+# a cached token always has most of its lifetime left.
+_token_cache = TTLCache(maxsize=10000, ttl=540)
+
+
+def _token_key(user_id: str, email: str) -> bytes:
+    return hashlib.blake2b(f"{user_id}:{email}".encode(), digest_size=16).digest()
+
+
+def _get_or_mint_token(user_id: str, email: str) -> str:
+    """Return a cached access token for the user, signing a new one on miss."""
+    key = _token_key(user_id, email)
+    token = _token_cache.get(key)
+    if token is None:
+        token = create_access_token(data={"user_id": user_id, "email": email})
+        _token_cache[key] = token
+    return token
+
+
+def invalidate_cached_token(user_id: str, email: str) -> None:
+    """Drop a user's cached token (password change, logout)."""
+    _token_cache.pop(_token_key(user_id, email), None)
+
+
+@dataclass(frozen=True)
+class _CachedUser:
+    """Detached snapshot of the User columns login needs."""
+
+    id: str
+    email: str
+    hashed_password: str
+    is_active: bool
+    role: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    created_at: Optional[datetime]
+    subscription_status: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "_CachedUser":
+        return cls(
+            id=str(user.id),
+            email=user.email,
+            hashed_password=user.hashed_password,
+            is_active=user.is_active,
+            role=user.role,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            created_at=user.created_at,
+            subscription_status=user.subscription_status,
+        )
+
+
+# Short-lived login lookup cache; snapshots rather than ORM instances so
+# nothing stays bound to a closed session.
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+
+
+def _norm_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a user's cached login snapshot (registration, profile changes)."""
+    _user_cache.pop(_norm_email(email), None)
+
 
 class AuthService:
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
     async def register_user(self, request: UserRegister) -> AuthResponse:
         """Register a new user with proper error handling"""
         try:
-            print(f"[AUTH SERVICE] Starting registration for: {request.email}")
+            email_norm = _norm_email(request.email)
+            logger.debug("Starting registration for: %s", email_norm)
 
-            # Check if user already exists
-            existing_user = (
-                self.db.query(User).filter(User.email == request.email).first()
+            # Create new user
+            hashed_pwd = await asyncio.get_running_loop().run_in_executor(
+                get_bcrypt_pool(), hash_password, request.password
             )
 
-            if existing_user:
-                print(f"[AUTH SERVICE] User already exists: {request.email}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered",
-                )
-
-            # Create new user
-            hashed_pwd = hash_password(request.password)
-
-            new_user = User(
-                id=uuid.uuid4(),
-                email=request.email,
-                hashed_password=hashed_pwd,
-                first_name=request.first_name,
-                last_name=request.last_name,
-                role=(
+            user_values = {
+                "id": uuid.uuid4(),
+                "email": email_norm,
+                "hashed_password": hashed_pwd,
+                "first_name": request.first_name,
+                "last_name": request.last_name,
+                "role": (
                     request.role
                     if hasattr(request, "role") and request.role
                     else "user"
                 ),
-                is_active=True,
-                created_at=datetime.utcnow(),
-                subscription_status="free",
-            )
+                "is_active": True,
+                "subscription_status": "free",
+            }
 
-            # Add to database
-            self.db.add(new_user)
+            # Insert atomically; the unique email index decides duplicates
+            result = self.db.execute(
+                insert(User)
+                .values(**user_values)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.created_at)
+            )
+            created = result.first()
+            if created is None:
+                logger.debug("User already exists: %s", email_norm)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered",
+                )
             self.db.commit()
-            self.db.refresh(new_user)
+            invalidate_cached_user(email_norm)
 
-            print(f"[AUTH SERVICE] User created successfully: {new_user.email}")
+            logger.debug("User created successfully: %s", email_norm)
 
             # Create access token
-            access_token = create_access_token(
-                data={"user_id": str(new_user.id), "email": new_user.email}
-            )
+            user_id_str = str(user_values["id"])
+            access_token = _get_or_mint_token(user_id_str, email_norm)
 
             # Create response
             user_response = UserResponse(
-                id=str(new_user.id),
-                email=new_user.email,
-                first_name=new_user.first_name,
-                last_name=new_user.last_name,
-                role=new_user.role,
-                is_active=new_user.is_active,
-                created_at=new_user.created_at,
-                subscription_status=new_user.subscription_status,
+                id=user_id_str,
+                email=user_values["email"],
+                first_name=user_values["first_name"],
+                last_name=user_values["last_name"],
+                role=user_values["role"],
+                is_active=user_values["is_active"],
+                created_at=created.created_at,
+                subscription_status=user_values["subscription_status"],
             )
 
             return AuthResponse(
@@ -85,7 +195,7 @@ class AuthService:
 
         except IntegrityError as e:
             self.db.rollback()
-            print(f"[AUTH SERVICE ERROR] Database integrity error: {str(e)}")
+            logger.error("Database integrity error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already exists or database constraint violated",
@@ -95,10 +205,7 @@ class AuthService:
             raise
         except Exception as e:
             self.db.rollback()
-            print(
-                f"[AUTH SERVICE ERROR] Unexpected error during registration: {str(e)}"
-            )
-            traceback.print_exc()
+            logger.exception("Unexpected error during registration: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Registration failed: {str(e)}",
@@ -107,21 +214,33 @@ class AuthService:
     async def login_user(self, request: UserLogin) -> AuthResponse:
         """Authenticate user and return token"""
         try:
-            print(f"[AUTH SERVICE] Login attempt for: {request.email}")
+            email_norm = _norm_email(request.email)
+            logger.debug("Login attempt for: %s", email_norm)
 
-            # Find user by email
-            user = self.db.query(User).filter(User.email == request.email).first()
+            # Find user by email, serving repeat attempts from the cache
+            user = _user_cache.get(email_norm)
+            if user is None:
+                row = self.db.query(User).filter(User.email == email_norm).first()
+                user = _CachedUser.from_user(row) if row else None
+                if user:
+                    _user_cache[email_norm] = user
 
             if not user:
-                print(f"[AUTH SERVICE] User not found: {request.email}")
+                logger.debug("User not found: %s", email_norm)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password",
                 )
 
             # Verify password
-            if not verify_password(request.password, user.hashed_password):
-                print(f"[AUTH SERVICE] Invalid password for: {request.email}")
+            password_ok = await asyncio.get_running_loop().run_in_executor(
+                get_bcrypt_pool(),
+                verify_password,
+                request.password,
+                user.hashed_password,
+            )
+            if not password_ok:
+                logger.debug("Invalid password for: %s", email_norm)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password",
@@ -129,22 +248,20 @@ class AuthService:
 
             # Check if user is active
             if not user.is_active:
-                print(f"[AUTH SERVICE] Inactive user attempted login: {request.email}")
+                logger.debug("Inactive user attempted login: %s", email_norm)
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Account is inactive. Please contact support.",
                 )
 
-            print(f"[AUTH SERVICE] Login successful for: {request.email}")
+            logger.debug("Login successful for: %s", email_norm)
 
             # Create access token
-            access_token = create_access_token(
-                data={"user_id": str(user.id), "email": user.email}
-            )
+            access_token = _get_or_mint_token(user.id, user.email)
 
             # Create response
             user_response = UserResponse(
-                id=str(user.id),
+                id=user.id,
                 email=user.email,
                 first_name=user.first_name,
                 last_name=user.last_name,
@@ -164,8 +281,7 @@ class AuthService:
         except HTTPException:
             raise
         except Exception as e:
-            print(f"[AUTH SERVICE ERROR] Unexpected error during login: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Unexpected error during login: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Login failed: {str(e)}",
@@ -1,10 +1,9 @@
 from typing import Optional, Dict, Any
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-import random
 
 from app.core.config import get_settings
 settings = get_settings()
-from app.utils.constants import USER_AGENTS, BROWSER_ARGS
+from app.utils.constants import BROWSER_ARGS, next_user_agent
 
 
 class BrowserService:
@@ -18,7 +17,7 @@ class BrowserService:
         """Initialize Playwright and browser"""
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
-            headless=settings.browser.headless, args=BROWSER_ARGS
+            headless=settings.browser.headless, args=list(BROWSER_ARGS)
         )
 
     async def stop(self):
@@ -35,7 +34,7 @@ class BrowserService:
                 "width": settings.browser.viewport_width,
                 "height": settings.browser.viewport_height,
             },
-            "user_agent": random.choice(USER_AGENTS),
+            "user_agent": next_user_agent(),
             "extra_http_headers": self._get_default_headers(),
         }
 
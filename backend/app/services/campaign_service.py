@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import func, lambda_stmt, select
 from fastapi import HTTPException
 
 from app.models.campaign import Campaign, CampaignStatus
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 class CampaignService:
     """Service for managing campaigns."""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -33,31 +35,24 @@ class CampaignService:
                 name=self._validate_name(campaign_data.name),
                 message=campaign_data.message,
                 status=CampaignStatus.DRAFT,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
             )
 
             self.db.add(campaign)
             self.db.commit()
-            self.db.refresh(campaign)
 
-            logger.info(f"Created campaign {campaign.id}")
+            logger.info("Created campaign %s", campaign.id)
             return campaign
 
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to create campaign: {e}")
+            logger.error("Failed to create campaign: %s", e)
             raise HTTPException(status_code=500, detail="Failed to create campaign")
 
     def get_campaign(
         self, campaign_id: uuid.UUID, user_id: uuid.UUID
     ) -> Optional[Campaign]:
         """Get a campaign by ID."""
-        return (
-            self.db.query(Campaign)
-            .filter(and_(Campaign.id == campaign_id, Campaign.user_id == user_id))
-            .first()
-        )
+        return self._get_owned_campaign(campaign_id, user_id)
 
     def update_campaign(
         self, campaign_id: uuid.UUID, user_id: uuid.UUID, campaign_data: CampaignUpdate
@@ -82,9 +77,8 @@ class CampaignService:
             campaign.updated_at = datetime.utcnow()
 
             self.db.commit()
-            self.db.refresh(campaign)
 
-            logger.info(f"Updated campaign {campaign_id}")
+            logger.info("Updated campaign %s", campaign_id)
             return campaign
 
         except HTTPException:
@@ -92,7 +86,7 @@ class CampaignService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to update campaign: {e}")
+            logger.error("Failed to update campaign: %s", e)
             raise HTTPException(status_code=500, detail="Failed to update campaign")
 
     def delete_campaign(self, campaign_id: uuid.UUID, user_id: uuid.UUID) -> bool:
@@ -108,15 +102,17 @@ class CampaignService:
                 )
 
             # Delete submissions
-            self.db.query(Submission).filter(
-                Submission.campaign_id == campaign_id
-            ).delete()
+            deleted = (
+                self.db.query(Submission)
+                .filter(Submission.campaign_id == campaign_id)
+                .delete(synchronize_session=False)
+            )
 
             # Delete campaign
             self.db.delete(campaign)
             self.db.commit()
 
-            logger.info(f"Deleted campaign {campaign_id}")
+            logger.info("Deleted campaign %s and %d submissions", campaign_id, deleted)
             return True
 
         except HTTPException:
@@ -124,24 +120,46 @@ class CampaignService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to delete campaign: {e}")
+            logger.error("Failed to delete campaign: %s", e)
             raise HTTPException(status_code=500, detail="Failed to delete campaign")
 
     def get_user_campaigns(
         self, user_id: uuid.UUID, page: int = 1, per_page: int = 10
     ) -> tuple[List[Campaign], int]:
         """Get user campaigns."""
-        query = self.db.query(Campaign).filter(Campaign.user_id == user_id)
-
-        total = query.count()
-        campaigns = (
-            query.order_by(Campaign.created_at.desc())
-            .offset((page - 1) * per_page)
+        # Page rows and the total come back from one scan via COUNT(*) OVER ();
+        # lambda_stmt caches the compiled SQL on the lambda's code object
+        offset = (page - 1) * per_page
+        stmt = lambda_stmt(
+            lambda: select(Campaign, func.count().over().label("total"))
+            .where(Campaign.user_id == user_id)
+            .order_by(Campaign.created_at.desc())
+            .offset(offset)
             .limit(per_page)
-            .all()
         )
+        campaigns, total = [], 0
+        for campaign, total in self.db.execute(
+            stmt, execution_options={"yield_per": 100}
+        ):
+            campaigns.append(campaign)
+
+        if campaigns:
+            return campaigns, total
+
+        # Past the last page the window has nothing to report on
+        total = (
+            self.db.query(Campaign).filter(Campaign.user_id == user_id).count()
+            if page > 1
+            else 0
+        )
+        return [], total
 
-        return campaigns, total
+    def _get_owned_campaign(
+        self, campaign_id: uuid.UUID, user_id: uuid.UUID
+    ) -> Optional[Campaign]:
+        """Primary-key lookup through the identity map, then an ownership check."""
+        campaign = self.db.get(Campaign, campaign_id)
+        return campaign if campaign and campaign.user_id == user_id else None
 
     def _validate_name(self, name: str) -> str:
         """Validate campaign name."""
@@ -2,11 +2,11 @@
 """Enhanced CAPTCHA detection and solving service with user profile integration."""
 
 import asyncio
-import base64
 import logging
 import os
-import requests
-from typing import Optional, Dict, Any
+import weakref
+import aiohttp
+from typing import Optional, Dict, Any, Tuple
 from playwright.async_api import Page
 from sqlalchemy.orm import Session
 
@@ -15,6 +15,82 @@ from app.models.user_profile import UserProfile
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for DBC to return a solution
+_DBC_POLL_TIMEOUT = 300
+
+# One pooled HTTP session per event loop (workers run their own loops)
+_http_sessions = weakref.WeakKeyDictionary()
+
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    """Return this loop's shared DBC session, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    session = _http_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        _http_sessions[loop] = session
+    return session
+
+
+async def close_http_session() -> None:
+    """Close every loop's shared session (application shutdown).
+
+    aiohttp sessions are bound to the loop that created them, so sessions of
+    other running loops (the campaign worker loop) are closed on that loop.
+    """
+    current = asyncio.get_running_loop()
+    for loop, session in list(_http_sessions.items()):
+        _http_sessions.pop(loop, None)
+        if session.closed:
+            continue
+        if loop is current:
+            await session.close()
+        elif loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+            try:
+                await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+            except Exception as e:
+                logger.warning(f"Error closing DBC session on another loop: {e}")
+
+
+# Browser-side CAPTCHA detection: mirrors the per-selector query/visibility
+# checks (and Playwright's :has-text) so the whole scan is one evaluate call.
+_DETECT_CAPTCHA_JS = """
+(patterns) => {
+    const visible = (el) => {
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0 &&
+            getComputedStyle(el).visibility !== 'hidden';
+    };
+    const scriptHit = () => Array.from(document.scripts).some((s) =>
+        (s.src && s.src.includes('recaptcha')) ||
+        (s.textContent || '').includes('grecaptcha'));
+    const first = (sel) => {
+        const m = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+        if (!m) return document.querySelector(sel);
+        const needle = m[2].toLowerCase();
+        return Array.from(document.querySelectorAll(m[1] || '*')).find(
+            (el) => (el.textContent || '').toLowerCase().includes(needle)) || null;
+    };
+    const out = {};
+    for (const [type, selectors] of Object.entries(patterns)) {
+        out[type] = selectors.some((sel) => {
+            try {
+                if (sel.startsWith('script')) return scriptHit();
+                const el = first(sel);
+                return !!el && visible(el);
+            } catch (e) {
+                return false;
+            }
+        });
+    }
+    return out;
+}
+"""
+
 
 class DeathByCaptchaAPI:
     """Death By Captcha API client with user-specific credentials."""
@@ -56,19 +132,19 @@ class DeathByCaptchaAPI:
             return 0.0
 
         try:
-            response = requests.post(
+            session = await _get_http_session()
+            async with session.post(
                 f"{self.base_url}/user",
                 data={"username": self.username, "password": self.password},
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                balance = float(result.get("balance", 0)) / 100  # Convert from cents
-                logger.info(f"DBC Balance: ${balance:.2f}")
-                return balance
-            else:
-                logger.error(f"DBC balance check failed: HTTP {response.status_code}")
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                if response.status == 200:
+                    result = await response.json(content_type=None)
+                    balance = float(result.get("balance", 0)) / 100  # From cents
+                    logger.info(f"DBC Balance: ${balance:.2f}")
+                    return balance
+                else:
+                    logger.error(f"DBC balance check failed: HTTP {response.status}")
 
         except Exception as e:
             logger.error(f"Error getting DBC balance: {e}")
@@ -88,23 +164,28 @@ class DeathByCaptchaAPI:
                 logger.error(f"Insufficient DBC balance: ${balance:.2f}")
                 return None
 
-            # Upload CAPTCHA
-            upload_data = {
-                "username": self.username,
-                "password": self.password,
-                "captchafile": base64.b64encode(image_data).decode("utf-8"),
-            }
+            # Upload CAPTCHA as a raw multipart file part (no base64 copies)
+            upload_data = aiohttp.FormData()
+            upload_data.add_field("username", self.username)
+            upload_data.add_field("password", self.password)
+            upload_data.add_field(
+                "captchafile",
+                image_data,
+                filename="captcha.png",
+                content_type="application/octet-stream",
+            )
 
             logger.info("Uploading CAPTCHA to Death By Captcha...")
-            response = requests.post(
-                f"{self.base_url}/captcha", data=upload_data, timeout=30
-            )
+            session = await _get_http_session()
+            async with session.post(
+                f"{self.base_url}/captcha", data=upload_data
+            ) as response:
+                if response.status != 200:
+                    logger.error(f"CAPTCHA upload failed: HTTP {response.status}")
+                    return None
 
-            if response.status_code != 200:
-                logger.error(f"CAPTCHA upload failed: HTTP {response.status_code}")
-                return None
+                result = await response.json(content_type=None)
 
-            result = response.json()
             if not result.get("captcha"):
                 logger.error("No captcha ID returned from DBC")
                 return None
@@ -112,29 +193,33 @@ class DeathByCaptchaAPI:
             captcha_id = result["captcha"]
             logger.info(f"CAPTCHA uploaded with ID: {captcha_id}")
 
-            # Poll for solution (max 5 minutes)
-            for attempt in range(60):
-                await asyncio.sleep(5)
+            # Poll for solution (max 5 minutes), backing off from 1s up to 5s
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _DBC_POLL_TIMEOUT
+            attempt = 0
+            while loop.time() < deadline:
+                await asyncio.sleep(min(5.0, 1.5**attempt))
+                attempt += 1
 
                 try:
-                    poll_response = requests.get(
-                        f"{self.base_url}/captcha/{captcha_id}", timeout=10
-                    )
-
-                    if poll_response.status_code == 200:
-                        poll_result = poll_response.json()
-                        if poll_result.get("text"):
-                            solution = poll_result["text"]
-                            logger.info(
-                                f"CAPTCHA solved: '{solution}' (attempt {attempt + 1})"
-                            )
-                            return solution
-                        elif poll_result.get("is_correct") == False:
-                            logger.error("CAPTCHA marked as incorrectly solved")
-                            return None
+                    async with session.get(
+                        f"{self.base_url}/captcha/{captcha_id}",
+                        timeout=aiohttp.ClientTimeout(total=10),
+                    ) as poll_response:
+                        if poll_response.status != 200:
+                            continue
+                        poll_result = await poll_response.json(content_type=None)
+
+                    if poll_result.get("text"):
+                        solution = poll_result["text"]
+                        logger.info(f"CAPTCHA solved: '{solution}' (attempt {attempt})")
+                        return solution
+                    elif poll_result.get("is_correct") == False:
+                        logger.error("CAPTCHA marked as incorrectly solved")
+                        return None
 
                 except Exception as e:
-                    logger.warning(f"Polling attempt {attempt + 1} failed: {e}")
+                    logger.warning(f"Polling attempt {attempt} failed: {e}")
 
             logger.error("CAPTCHA solving timeout (5 minutes)")
             return None
@@ -149,13 +234,13 @@ class DeathByCaptchaAPI:
             return False
 
         try:
-            response = requests.post(
+            session = await _get_http_session()
+            async with session.post(
                 f"{self.base_url}/captcha/{captcha_id}/report",
                 data={"username": self.username, "password": self.password},
-                timeout=10,
-            )
-
-            success = response.status_code == 200
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                success = response.status == 200
             if success:
                 logger.info(f"Reported incorrect CAPTCHA: {captcha_id}")
             else:
@@ -249,40 +334,12 @@ class CaptchaService:
 
     async def detect_captcha_types(self, page: Page) -> Dict[str, bool]:
         """Detect all CAPTCHA types present on the page."""
-        detected = {}
-
-        for captcha_type, selectors in self.captcha_patterns.items():
-            detected[captcha_type] = False
-
-            for selector in selectors:
-                try:
-                    if selector.startswith("script"):
-                        # Check for script-based CAPTCHAs
-                        scripts = await page.query_selector_all("script")
-                        for script in scripts:
-                            src = await script.get_attribute("src")
-                            content = await script.inner_text()
-
-                            if (src and "recaptcha" in src) or (
-                                "grecaptcha" in content
-                            ):
-                                detected[captcha_type] = True
-                                break
-                    else:
-                        # Check for element-based CAPTCHAs
-                        element = await page.query_selector(selector)
-                        if element:
-                            is_visible = await element.is_visible()
-                            if is_visible:
-                                detected[captcha_type] = True
-                                break
-
-                except Exception as e:
-                    self._log_warning(f"Error checking selector '{selector}': {e}")
-                    continue
-
-                if detected[captcha_type]:
-                    break
+        try:
+            # All patterns are checked in the page with one CDP round-trip
+            detected = await page.evaluate(_DETECT_CAPTCHA_JS, self.captcha_patterns)
+        except Exception as e:
+            self._log_warning(f"Error checking CAPTCHA selectors: {e}")
+            detected = {captcha_type: False for captcha_type in self.captcha_patterns}
 
         # Log detected CAPTCHAs
         found_types = [t for t, detected in detected.items() if detected]
@@ -291,16 +348,23 @@ class CaptchaService:
 
         return detected
 
-    async def solve_if_present(self, page: Page, timeout_ms: int = 30000) -> bool:
-        """Detect and solve CAPTCHA if present."""
+    async def solve_if_present(
+        self, page: Page, timeout_ms: int = 30000
+    ) -> Tuple[bool, Optional[str]]:
+        """Detect and solve CAPTCHA if present.
+
+        Returns ``(solved, captcha_type)``; ``captcha_type`` is the type that was
+        handled, or None when the page has no CAPTCHA.
+        """
         try:
             detected_types = await self.detect_captcha_types(page)
 
             # No CAPTCHAs detected
             if not any(detected_types.values()):
-                return True  # No CAPTCHA to solve = success
+                return True, None  # No CAPTCHA to solve = success
 
             self._log_info("CAPTCHA detected, attempting to solve...")
+            captcha_type = next(t for t, found in detected_types.items() if found)
 
             # Check if user has DBC credentials
             if not self.dbc.enabled:
@@ -310,14 +374,14 @@ class CaptchaService:
                     )
                 else:
                     self._log_warning("No Death By Captcha credentials available")
-                return False
+                return False, captcha_type
 
             # Solve image CAPTCHAs first (most reliable)
             if detected_types.get("image_captcha"):
                 success = await self._solve_image_captcha(page)
                 if success:
                     await self._log_captcha_success("image_captcha")
-                    return True
+                    return True, "image_captcha"
                 else:
                     await self._log_captcha_failure("image_captcha")
 
@@ -326,25 +390,25 @@ class CaptchaService:
                 self._log_warning(
                     "reCAPTCHA v2 detected - manual intervention may be required"
                 )
-                return await self._handle_recaptcha_v2(page)
+                return await self._handle_recaptcha_v2(page), "recaptcha_v2"
 
             if detected_types.get("hcaptcha"):
                 self._log_warning(
                     "hCaptcha detected - manual intervention may be required"
                 )
-                return await self._handle_hcaptcha(page)
+                return await self._handle_hcaptcha(page), "hcaptcha"
 
             if detected_types.get("turnstile"):
                 self._log_warning(
                     "Turnstile detected - waiting for automatic resolution"
                 )
-                return await self._handle_turnstile(page)
+                return await self._handle_turnstile(page), "turnstile"
 
-            return False
+            return False, captcha_type
 
         except Exception as e:
             self._log_error(f"CAPTCHA solving error: {e}")
-            return False
+            return False, None
 
     async def _solve_image_captcha(self, page: Page) -> bool:
         """Solve image-based CAPTCHA."""
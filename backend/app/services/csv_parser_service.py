@@ -1,10 +1,13 @@
 # app/services/csv_parser_service.py
 """CSV parsing service for handling file uploads."""
 
+import asyncio
+import codecs
 import csv
 import io
 import logging
-from typing import List, Dict, Any, Tuple
+import re
+from typing import AsyncIterator, Iterator, List
 
 logger = logging.getLogger(__name__)
 
@@ -32,130 +35,170 @@ class CSVParserService:
         "Webpage",
     ]
 
+    # Any alias as a substring of a header, tested once per header
+    _URL_COLUMN_RE = re.compile(
+        "|".join(
+            re.escape(col) for col in dict.fromkeys(c.lower() for c in URL_COLUMNS)
+        ),
+        re.IGNORECASE,
+    )
+    _URL_COLUMN_SET = frozenset(URL_COLUMNS)
+
+    # Scheme/www prefix or a common TLD anywhere (".co" also covers ".com")
+    _URL_RE = re.compile(r"^\s*(?:https?://|www\.)|\.(?:co|org|net|io)", re.IGNORECASE)
+
     @classmethod
-    async def parse_csv_file(
-        cls, file_content: bytes
-    ) -> Tuple[List[str], List[str], List[str]]:
+    async def parse_csv_stream(
+        cls,
+        file_content: bytes,
+        errors: List[str],
+        headers: List[str],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[str]]:
         """
-        Parse CSV file and extract URLs.
+        Parse CSV file and yield URLs in batches.
 
         Args:
             file_content: Raw CSV file content
+            errors: List that row and parsing errors are appended to
+            headers: List that the header row is written into
+            batch_size: Maximum number of URLs per batch
+
+        Yields:
+            Lists of at most batch_size URLs
+        """
+        content_str = await asyncio.to_thread(cls._decode, file_content)
+        batches = cls._iter_url_batches(content_str, errors, headers, batch_size)
+
+        # Each batch is parsed in a worker thread, off the event loop
+        while True:
+            batch = await asyncio.to_thread(next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
+    @staticmethod
+    def _sniff_encoding(file_content: bytes) -> str:
+        """Pick an encoding from the BOM or a UTF-8 check of the first 64KB."""
+        if file_content.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        if file_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return "utf-16"
+        try:
+            # Incremental so a multi-byte char split at the cut is not an error
+            codecs.getincrementaldecoder("utf-8")().decode(file_content[:65536])
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
+
+    @classmethod
+    def _decode(cls, file_content: bytes) -> str:
+        """Decode the upload once, falling back to latin-1 on a late failure."""
+        try:
+            return file_content.decode(cls._sniff_encoding(file_content))
+        except UnicodeDecodeError:
+            return file_content.decode("latin-1")
 
-        Returns:
-            Tuple of (urls, errors, headers)
+    @classmethod
+    def _iter_url_batches(
+        cls,
+        content_str: str,
+        errors: List[str],
+        headers: List[str],
+        batch_size: int = 1000,
+    ) -> Iterator[List[str]]:
+        """Yield URLs from decoded CSV text in batches of ``batch_size``.
+
+        Row errors and the header row are appended to the given lists.
         """
-        urls = []
-        errors = []
-        headers = []
+        batch = []
+        url_count = 0
 
         try:
-            # Decode content
-            content_str = file_content.decode("utf-8-sig")  # Handle BOM
-            csv_reader = csv.DictReader(io.StringIO(content_str))
+            csv_reader = csv.reader(io.StringIO(content_str))
 
             # Get headers
-            headers = csv_reader.fieldnames or []
+            headers.extend(next(csv_reader, []))
             logger.info(f"CSV headers detected: {headers}")
 
-            # Find URL column
-            url_column = cls._find_url_column(headers)
+            # Resolve the URL column position once
+            url_idx = cls._find_url_column_idx(headers)
 
-            if not url_column and headers:
+            if url_idx < 0 and headers:
                 # If no standard URL column, try first column
-                url_column = headers[0]
+                url_idx = 0
                 logger.warning(
-                    f"No standard URL column found, using first column: {url_column}"
+                    f"No standard URL column found, using first column: {headers[0]}"
                 )
 
+            # Exact-name URL columns checked when the chosen one is empty
+            fallback_idxs = [
+                i for i, header in enumerate(headers) if header in cls._URL_COLUMN_SET
+            ]
+
             # Parse rows
-            for row_num, row in enumerate(csv_reader, start=1):
-                url = cls._extract_url_from_row(row, url_column)
+            row_num = 0
+            for row in csv_reader:
+                if not row:
+                    continue
+                row_num += 1
+
+                url = cls._extract_url_from_row(row, url_idx, fallback_idxs)
 
-                if url:
-                    urls.append(url)
-                else:
+                if not url:
                     # Try to find URL in any column
-                    url_found = False
-                    for col_name, col_value in row.items():
-                        if col_value and cls._looks_like_url(col_value):
-                            urls.append(col_value.strip())
-                            url_found = True
+                    for value in row:
+                        if value and cls._looks_like_url(value):
+                            url = value.strip()
                             break
-
-                    if not url_found:
+                    else:
                         errors.append(f"Row {row_num}: No valid URL found")
+                        continue
 
-            logger.info(f"Parsed CSV: {len(urls)} URLs found, {len(errors)} errors")
+                batch.append(url)
+                if len(batch) >= batch_size:
+                    url_count += len(batch)
+                    yield batch
+                    batch = []
 
-        except UnicodeDecodeError:
-            # Try different encoding
-            try:
-                content_str = file_content.decode("latin-1")
-                return await cls._parse_with_encoding(content_str)
-            except Exception as e:
-                logger.error(f"CSV encoding error: {e}")
-                errors.append("File encoding error - please use UTF-8")
         except Exception as e:
             logger.error(f"CSV parsing error: {e}")
             errors.append(f"Parsing error: {str(e)}")
 
-        return urls, errors, headers
+        if batch:
+            url_count += len(batch)
+            yield batch
 
-    @classmethod
-    def _find_url_column(cls, headers: List[str]) -> str:
-        """Find the column containing URLs."""
-        for header in headers:
-            if header:
-                header_lower = header.lower().strip()
-                for url_col in cls.URL_COLUMNS:
-                    if url_col.lower() in header_lower:
-                        return header
-        return ""
+        logger.info(f"Parsed CSV: {url_count} URLs found, {len(errors)} errors")
 
     @classmethod
-    def _extract_url_from_row(cls, row: Dict[str, Any], url_column: str) -> str:
+    def _find_url_column_idx(cls, headers: List[str]) -> int:
+        """Find the position of the column containing URLs, or -1."""
+        for idx, header in enumerate(headers):
+            if header and cls._URL_COLUMN_RE.search(header):
+                return idx
+        return -1
+
+    @staticmethod
+    def _extract_url_from_row(
+        row: List[str], url_idx: int, fallback_idxs: List[int]
+    ) -> str:
         """Extract URL from a CSV row."""
-        if url_column and url_column in row:
-            value = row[url_column]
-            if value and value.strip():
-                return value.strip()
+        if 0 <= url_idx < len(row):
+            value = row[url_idx].strip()
+            if value:
+                return value
 
         # Fallback: check common columns
-        for col in cls.URL_COLUMNS:
-            if col in row and row[col] and row[col].strip():
-                return row[col].strip()
+        for idx in fallback_idxs:
+            if idx < len(row):
+                value = row[idx].strip()
+                if value:
+                    return value
 
         return ""
 
     @classmethod
     def _looks_like_url(cls, value: str) -> bool:
         """Check if a value looks like a URL."""
-        if not value:
-            return False
-
-        value = value.strip().lower()
-        return "." in value and (
-            value.startswith(("http://", "https://", "www."))
-            or any(tld in value for tld in [".com", ".org", ".net", ".io", ".co"])
-        )
-
-    @classmethod
-    async def _parse_with_encoding(
-        cls, content_str: str
-    ) -> Tuple[List[str], List[str], List[str]]:
-        """Parse CSV with specific encoding."""
-        urls = []
-        errors = []
-        headers = []
-
-        csv_reader = csv.DictReader(io.StringIO(content_str))
-        headers = csv_reader.fieldnames or []
-
-        for row_num, row in enumerate(csv_reader, start=1):
-            for value in row.values():
-                if value and cls._looks_like_url(value):
-                    urls.append(value.strip())
-                    break
-
-        return urls, errors, headers
+        return bool(value) and "." in value and cls._URL_RE.search(value) is not None
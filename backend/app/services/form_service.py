@@ -1,13 +1,55 @@
 # app/services/form_service.py
 """Form detection and interaction service."""
 
+import asyncio
 import logging
+import re
 from typing import Dict, List, Optional, Any
 
 from playwright.async_api import Page, ElementHandle
 
 logger = logging.getLogger(__name__)
 
+# For each field type, the first selector whose first match is visible. One
+# querySelectorAll over the union walks the DOM once; it returns document
+# order, so the first element matching a selector is what querySelector gives.
+_MATCH_FIELDS_JS = """
+([union, patterns]) => {
+    const visible = (el) => {
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0 &&
+            getComputedStyle(el).visibility !== 'hidden';
+    };
+    const candidates = [...document.querySelectorAll(union)];
+    const out = {};
+    for (const [type, selectors] of Object.entries(patterns)) {
+        const hit = selectors.find((sel) => {
+            const el = candidates.find((c) => c.matches(sel));
+            return !!el && visible(el);
+        });
+        if (hit) out[type] = hit;
+    }
+    return out;
+}
+"""
+
+# Controls a contact form can hold; shared by every form lookup
+_FORM_INPUTS_SELECTOR = "input, textarea, select"
+
+# Find the form's submit control and click it in a single round-trip
+_CLICK_SUBMIT_JS = """
+(form) => {
+    const btn =
+        form.querySelector('button[type="submit"], input[type="submit"]') ||
+        [...form.querySelectorAll('button')].find((b) =>
+            /send|submit|contact|get in touch/i.test(b.textContent)
+        );
+    if (!btn) return false;
+    btn.click();
+    return true;
+}
+"""
+
 
 class FormService:
     """Handle form detection and interaction."""
@@ -22,6 +64,8 @@ class FormService:
         "submit",
         "email us",
     ]
+    # One case-insensitive alternation instead of a scan per indicator
+    CONTACT_PATTERN = "|".join(re.escape(i) for i in CONTACT_INDICATORS)
 
     FIELD_PATTERNS = {
         "email": ['input[type="email"]', 'input[name*="email" i]'],
@@ -31,15 +75,23 @@ class FormService:
         "subject": ['input[name*="subject" i]'],
         "company": ['input[name*="company" i]'],
     }
+    ALL_FIELD_SELECTOR = ", ".join(
+        dict.fromkeys(sel for sels in FIELD_PATTERNS.values() for sel in sels)
+    )
 
     async def detect_form(self, page: Page) -> Optional[Dict[str, Any]]:
         """Detect suitable form on page."""
         try:
             forms = await page.query_selector_all("form")
 
-            for form in forms:
-                if await self._is_contact_form(form):
-                    inputs = await form.query_selector_all("input, textarea, select")
+            # Inspect every form concurrently, then keep page order
+            contact_flags = await asyncio.gather(
+                *(self._is_contact_form(form) for form in forms)
+            )
+
+            for form, is_contact in zip(forms, contact_flags):
+                if is_contact:
+                    inputs = await form.query_selector_all(_FORM_INPUTS_SELECTOR)
 
                     if inputs:
                         return {
@@ -50,7 +102,7 @@ class FormService:
 
             # Return first form if no contact form found
             if forms:
-                inputs = await forms[0].query_selector_all("input, textarea, select")
+                inputs = await forms[0].query_selector_all(_FORM_INPUTS_SELECTOR)
                 return {
                     "form": forms[0],
                     "inputs": inputs,
@@ -69,21 +121,31 @@ class FormService:
         try:
             filled_count = 0
 
-            for field_type, selectors in self.FIELD_PATTERNS.items():
-                value = self._get_field_value(field_type, user_data)
-
-                if not value:
-                    continue
-
-                for selector in selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element and await element.is_visible():
-                            await element.fill(value)
-                            filled_count += 1
-                            break
-                    except Exception:
-                        pass
+            values = {
+                field_type: self._get_field_value(field_type, user_data)
+                for field_type in self.FIELD_PATTERNS
+            }
+            patterns = {
+                field_type: selectors
+                for field_type, selectors in self.FIELD_PATTERNS.items()
+                if values[field_type]
+            }
+
+            # Resolve the first visible selector per field in one round-trip
+            matched = (
+                await page.evaluate(
+                    _MATCH_FIELDS_JS, [self.ALL_FIELD_SELECTOR, patterns]
+                )
+                if patterns
+                else {}
+            )
+
+            for field_type, selector in matched.items():
+                try:
+                    await page.fill(selector, values[field_type], timeout=5000)
+                    filled_count += 1
+                except Exception:
+                    pass
 
             logger.info(f"Filled {filled_count} form fields")
             return filled_count > 0
@@ -92,13 +154,22 @@ class FormService:
             logger.error(f"Error filling form: {e}")
             return False
 
+    async def submit_form(self, form_info: Dict[str, Any]) -> bool:
+        """Click the detected form's submit button."""
+        try:
+            return await form_info["form"].evaluate(_CLICK_SUBMIT_JS)
+        except Exception as e:
+            logger.error(f"Error submitting form: {e}")
+            return False
+
     async def _is_contact_form(self, form: ElementHandle) -> bool:
         """Check if form is likely a contact form."""
         try:
-            form_html = await form.inner_html()
-            form_text = form_html.lower()
-
-            return any(indicator in form_text for indicator in self.CONTACT_INDICATORS)
+            # Scan the markup in the page instead of shipping it to Python
+            return await form.evaluate(
+                "(el, pattern) => new RegExp(pattern, 'i').test(el.innerHTML)",
+                self.CONTACT_PATTERN,
+            )
         except Exception:
             return False
 
@@ -111,6 +111,8 @@ class LogService:
         user_id = kwargs.pop("user_id", None)
         campaign_id = kwargs.pop("campaign_id", None)
         context = kwargs.pop("context", None)
+        # console=False records the event without echoing it to the logger
+        console = kwargs.pop("console", True)
         # ignore db/db_session at class level
         kwargs.pop("db_session", None)
         kwargs.pop("db", None)
@@ -141,9 +143,10 @@ class LogService:
             text = "" if msg is None else str(msg)
             level = _coerce_level(level or "INFO")
 
-        cls._log_to_console(
-            level, text, user_id=user_id, campaign_id=campaign_id, context=context
-        )
+        if console:
+            cls._log_to_console(
+                level, text, user_id=user_id, campaign_id=campaign_id, context=context
+            )
         evt = cls._append_event(
             level, text, user_id=user_id, campaign_id=campaign_id, context=context
         )
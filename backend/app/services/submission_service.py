@@ -4,10 +4,10 @@
 import uuid
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy import desc, and_, or_, func, update
 from fastapi import HTTPException
 
 from app.models.submission import Submission, SubmissionStatus
@@ -21,6 +21,17 @@ from app.utils.status_converter import StatusConverter
 
 logger = logging.getLogger(__name__)
 
+# Error substrings that mark a failed submission as not worth retrying
+_PERMANENT_ERROR_PATTERNS = (
+    "invalid url",
+    "404",
+    "403",
+    "dns",
+    "certificate",
+    "ssl",
+    "no forms found",
+)
+
 
 class SubmissionService:
     """Service for managing form submissions."""
@@ -29,6 +40,12 @@ class SubmissionService:
         self.db = db
         self.url_validator = URLValidator()
         self.status_converter = StatusConverter()
+        # SubmissionLog rows waiting to be written in one batch
+        self._log_buffer: List[Dict[str, Any]] = []
+        # (campaign_id, user_id) -> campaign status, checked once per instance
+        self._campaign_ownership: Dict[
+            Tuple[uuid.UUID, uuid.UUID], Optional[CampaignStatus]
+        ] = {}
 
     def create_submission(
         self, user_id: uuid.UUID, submission_data: SubmissionCreate
@@ -40,7 +57,7 @@ class SubmissionService:
 
             # Validate campaign
             if submission_data.campaign_id:
-                self._validate_campaign(submission_data.campaign_id, user_id)
+                self._assert_campaign_owned(submission_data.campaign_id, user_id)
                 self._check_duplicate_url(submission_data.campaign_id, clean_url)
 
             # Convert status
@@ -62,12 +79,12 @@ class SubmissionService:
 
             self.db.add(submission)
             self.db.commit()
-            self.db.refresh(submission)
 
             logger.info(f"Created submission {submission.id}")
             self._log_event(
-                submission.id, "created", f"Submission created for {clean_url}"
+                submission, "created", f"Submission created for {clean_url}"
             )
+            self._flush_logs(commit=True)
 
             return submission
 
@@ -133,7 +150,6 @@ class SubmissionService:
             self._update_timestamps(submission)
 
             self.db.commit()
-            self.db.refresh(submission)
 
             logger.info(f"Updated submission {submission_id}")
             return submission
@@ -146,51 +162,40 @@ class SubmissionService:
             logger.error(f"Failed to update submission: {e}")
             raise HTTPException(status_code=500, detail="Failed to update submission")
 
-    def bulk_create_submissions(
-        self, user_id: uuid.UUID, campaign_id: uuid.UUID, urls: List[str]
-    ) -> Tuple[List[Submission], List[str]]:
-        """Bulk create submissions."""
+    async def bulk_create_submissions_stream(
+        self,
+        user_id: uuid.UUID,
+        campaign_id: uuid.UUID,
+        url_batches: AsyncIterator[List[str]],
+    ) -> Tuple[int, int, List[str]]:
+        """Bulk create submissions from batches of URLs, inserting per batch.
+
+        Nothing is committed; the caller owns the transaction. Returns
+        (created_count, url_count, errors).
+        """
         try:
             # Validate campaign
-            self._validate_campaign(campaign_id, user_id)
+            self._assert_campaign_owned(campaign_id, user_id)
 
             # Get existing URLs
             existing_urls = self._get_existing_urls(campaign_id)
 
-            submissions = []
             errors = []
+            created = 0
+            url_count = 0
 
-            for i, url in enumerate(urls):
-                try:
-                    clean_url = self.url_validator.validate_and_normalize(url)
-
-                    if clean_url in existing_urls:
-                        errors.append(f"Row {i+1}: Duplicate URL")
-                        continue
-
-                    submission = Submission(
-                        campaign_id=campaign_id,
-                        user_id=user_id,
-                        url=clean_url,
-                        status=SubmissionStatus.PENDING,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                    )
-                    submissions.append(submission)
-                    existing_urls.add(clean_url)
-
-                except ValueError as e:
-                    errors.append(f"Row {i+1}: {str(e)}")
-
-            if submissions:
-                self.db.add_all(submissions)
-                self.db.commit()
+            async for urls in url_batches:
+                mappings = self._build_mappings(
+                    user_id, campaign_id, urls, existing_urls, errors, url_count
+                )
+                url_count += len(urls)
 
-                for submission in submissions:
-                    self.db.refresh(submission)
+                if mappings:
+                    self.db.bulk_insert_mappings(Submission, mappings)
+                    created += len(mappings)
 
-            logger.info(f"Bulk created {len(submissions)} submissions")
-            return submissions, errors
+            logger.info(f"Bulk created {created} submissions")
+            return created, url_count, errors
 
         except HTTPException:
             self.db.rollback()
@@ -211,7 +216,7 @@ class SubmissionService:
         """Get paginated campaign submissions."""
         try:
             # Validate campaign
-            self._validate_campaign(campaign_id, user_id)
+            self._assert_campaign_owned(campaign_id, user_id)
 
             # Build query
             query = self.db.query(Submission).filter(
@@ -221,16 +226,20 @@ class SubmissionService:
             # Apply filters
             query = self._apply_filters(query, filters)
 
-            # Get total and paginated results
-            total = query.count()
-            submissions = (
-                query.order_by(desc(Submission.created_at))
+            # Page rows and the total from one scan via COUNT(*) OVER ()
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .order_by(desc(Submission.created_at))
                 .offset((page - 1) * per_page)
                 .limit(per_page)
                 .all()
             )
 
-            return submissions, total
+            if rows:
+                return [submission for submission, _ in rows], rows[0].total
+
+            # Past the last page the window has nothing to report on
+            return [], query.count() if page > 1 else 0
 
         except HTTPException:
             raise
@@ -271,51 +280,62 @@ class SubmissionService:
         """Retry failed submissions."""
         try:
             # Validate campaign
-            self._validate_campaign(campaign_id, user_id)
-
-            # Get failed submissions
-            failed = (
-                self.db.query(Submission)
-                .filter(
-                    and_(
-                        Submission.campaign_id == campaign_id,
-                        Submission.status == SubmissionStatus.FAILED,
-                        Submission.retry_count < max_retries,
-                    )
-                )
-                .all()
-            )
+            self._assert_campaign_owned(campaign_id, user_id)
 
-            retried = 0
-            skipped = 0
-
-            for submission in failed:
-                if self._is_permanent_error(submission.error_message):
-                    skipped += 1
-                    continue
+            retryable = and_(
+                Submission.campaign_id == campaign_id,
+                Submission.status == SubmissionStatus.FAILED,
+                Submission.retry_count < max_retries,
+            )
 
-                # Reset for retry
-                submission.status = SubmissionStatus.PENDING
-                submission.retry_count += 1
-                submission.error_message = None
-                submission.updated_at = datetime.utcnow()
-                submission.processed_at = None
-                submission.started_at = None
+            # Reset every non-permanent failure in one UPDATE ... RETURNING
+            retried_rows = self.db.execute(
+                update(Submission)
+                .where(
+                    retryable,
+                    or_(
+                        Submission.error_message.is_(None),
+                        ~self._permanent_error_clause(),
+                    ),
+                )
+                .values(
+                    status=SubmissionStatus.PENDING.value,
+                    retry_count=Submission.retry_count + 1,
+                    error_message=None,
+                    updated_at=datetime.utcnow(),
+                    processed_at=None,
+                )
+                .returning(
+                    Submission.id,
+                    Submission.campaign_id,
+                    Submission.user_id,
+                    Submission.website_id,
+                    Submission.url,
+                    Submission.retry_count,
+                )
+                .execution_options(synchronize_session=False)
+            ).all()
 
-                retried += 1
+            # Whatever still matches after the reset failed permanently
+            skipped = (
+                self.db.query(func.count(Submission.id)).filter(retryable).scalar()
+            )
+            retried = len(retried_rows)
 
+            for row in retried_rows:
                 self._log_event(
-                    submission.id,
+                    row,
                     "retry",
-                    f"Retry attempt {submission.retry_count}/{max_retries}",
+                    f"Retry attempt {row.retry_count}/{max_retries}",
                 )
 
+            self._flush_logs()
             self.db.commit()
 
             return {
                 "retried_count": retried,
                 "skipped_count": skipped,
-                "total_failed": len(failed),
+                "total_failed": retried + skipped,
             }
 
         except HTTPException:
@@ -328,24 +348,26 @@ class SubmissionService:
 
     # Private helper methods
 
-    def _validate_campaign(self, campaign_id: uuid.UUID, user_id: uuid.UUID):
-        """Validate campaign exists and belongs to user."""
-        campaign = (
-            self.db.query(Campaign)
-            .filter(and_(Campaign.id == campaign_id, Campaign.user_id == user_id))
-            .first()
-        )
+    def _assert_campaign_owned(self, campaign_id: uuid.UUID, user_id: uuid.UUID):
+        """Validate campaign exists, belongs to user and is still modifiable."""
+        key = (campaign_id, user_id)
+        if key not in self._campaign_ownership:
+            # Only the status column is needed; skip hydrating a Campaign
+            self._campaign_ownership[key] = (
+                self.db.query(Campaign.status)
+                .filter(and_(Campaign.id == campaign_id, Campaign.user_id == user_id))
+                .scalar()
+            )
+        status = self._campaign_ownership[key]
 
-        if not campaign:
+        if status is None:
             raise HTTPException(status_code=404, detail="Campaign not found")
 
-        if campaign.status == CampaignStatus.COMPLETED:
+        if status == CampaignStatus.COMPLETED:
             raise HTTPException(
                 status_code=400, detail="Cannot modify completed campaign"
             )
 
-        return campaign
-
     def _check_duplicate_url(self, campaign_id: uuid.UUID, url: str):
         """Check for duplicate URLs in campaign."""
         existing = (
@@ -368,6 +390,45 @@ class SubmissionService:
         )
         return {url[0] for url in urls}
 
+    def _build_mappings(
+        self,
+        user_id: uuid.UUID,
+        campaign_id: uuid.UUID,
+        urls: List[str],
+        existing_urls: set,
+        errors: List[str],
+        row_offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Validate URLs and build insert mappings, skipping duplicates."""
+        mappings = []
+        now = datetime.utcnow()
+
+        for i, url in enumerate(urls, start=row_offset + 1):
+            try:
+                clean_url = self.url_validator.validate_and_normalize(url)
+
+                if clean_url in existing_urls:
+                    errors.append(f"Row {i}: Duplicate URL")
+                    continue
+
+                mappings.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "campaign_id": campaign_id,
+                        "user_id": user_id,
+                        "url": clean_url,
+                        "status": SubmissionStatus.PENDING,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                existing_urls.add(clean_url)
+
+            except ValueError as e:
+                errors.append(f"Row {i}: {str(e)}")
+
+        return mappings
+
     def _can_modify(self, submission: Submission) -> bool:
         """Check if submission can be modified."""
         return submission.status in [SubmissionStatus.PENDING, SubmissionStatus.FAILED]
@@ -400,51 +461,52 @@ class SubmissionService:
 
         return query
 
-    def _is_permanent_error(self, error_message: Optional[str]) -> bool:
-        """Check if error is permanent."""
-        if not error_message:
-            return False
-
-        permanent_patterns = [
-            "invalid url",
-            "404",
-            "403",
-            "dns",
-            "certificate",
-            "ssl",
-            "no forms found",
-        ]
-
-        error_lower = error_message.lower()
-        return any(pattern in error_lower for pattern in permanent_patterns)
+    def _permanent_error_clause(self):
+        """SQL predicate matching errors that retrying will not fix."""
+        return or_(
+            *(
+                Submission.error_message.ilike(f"%{pattern}%")
+                for pattern in _PERMANENT_ERROR_PATTERNS
+            )
+        )
 
     def _log_event(
-        self, submission_id: uuid.UUID, action: str, details: str, status: str = "info"
+        self, submission: Submission, action: str, details: str, status: str = "info"
     ):
-        """Log submission event."""
-        try:
-            submission = (
-                self.db.query(Submission).filter(Submission.id == submission_id).first()
-            )
+        """Queue a submission event; written by the next _flush_logs()."""
+        self._log_buffer.append(
+            {
+                "campaign_id": submission.campaign_id,
+                "submission_id": submission.id,
+                "user_id": submission.user_id,
+                "website_id": submission.website_id,
+                "target_url": submission.url,
+                "action": action,
+                "details": details,
+                "status": status,
+                "timestamp": datetime.utcnow(),
+            }
+        )
+        if len(self._log_buffer) >= 100:
+            self._flush_logs()
 
-            if submission:
-                log = SubmissionLog(
-                    campaign_id=submission.campaign_id,
-                    submission_id=submission_id,
-                    user_id=submission.user_id,
-                    website_id=submission.website_id,
-                    target_url=submission.url,
-                    action=action,
-                    details=details,
-                    status=status,
-                    timestamp=datetime.utcnow(),
-                )
+    def _flush_logs(self, commit: bool = False):
+        """Insert buffered submission events in a single statement."""
+        if not self._log_buffer:
+            return
 
-                self.db.add(log)
+        batch, self._log_buffer = self._log_buffer, []
+        try:
+            # A failed log write rolls back only its savepoint, leaving the
+            # caller's pending work committable
+            with self.db.begin_nested():
+                self.db.bulk_insert_mappings(SubmissionLog, batch)
+            if commit:
                 self.db.commit()
-
         except Exception as e:
-            logger.error(f"Failed to log event: {e}")
+            if commit:
+                self.db.rollback()
+            logger.error(f"Failed to log events: {e}")
 
     def _get_default_profile(self) -> Dict[str, Any]:
         """Get default profile data."""
@@ -1,8 +1,10 @@
 # app/services/user_service.py
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
@@ -14,6 +16,25 @@ from app.schemas.user import (
     UserProfileResponse,
 )
 from app.core.encryption import encryption_service
+from app.services.auth_service import invalidate_cached_user
+
+
+# ON CONFLICT (user_id) needs a unique index on user_profiles.user_id. Tables
+# created before it was added get it from app/migrations/migrate.py; until
+# then profiles are saved with a read-then-write. Checked once per process.
+_PROFILE_UPSERT_SUPPORTED: Optional[bool] = None
+
+_USER_ID_UNIQUE_SQL = text(
+    """
+    SELECT 1
+    FROM pg_index i
+    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+    WHERE i.indrelid = 'user_profiles'::regclass
+      AND i.indisunique
+      AND i.indnatts = 1
+      AND a.attname = 'user_id'
+    """
+)
 
 
 def _s(v):
@@ -47,6 +68,8 @@ class UserService:
 
     def __init__(self, db: Session):
         self.db = db
+        # user_id -> profile (or None), loaded at most once per instance
+        self._profile_cache: Dict[uuid.UUID, Optional[UserProfile]] = {}
 
     # -------------------
     # Users
@@ -63,6 +86,7 @@ class UserService:
             return False
         self.db.delete(user)
         self.db.commit()
+        invalidate_cached_user(user.email)
         return True
 
     def update_user_status(self, user_id: uuid.UUID, is_active: bool) -> User:
@@ -71,7 +95,7 @@ class UserService:
             raise HTTPException(status_code=404, detail="User not found")
         user.is_active = is_active
         self.db.commit()
-        self.db.refresh(user)
+        invalidate_cached_user(user.email)
         return user
 
     def update_captcha_credentials(
@@ -81,67 +105,93 @@ class UserService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        user.captcha_username = encryption_service.encrypt(username or "")
-        user.captcha_password_hash = encryption_service.encrypt(password or "")
+        (
+            user.captcha_username,
+            user.captcha_password_hash,
+        ) = encryption_service.encrypt_many([username or "", password or ""])
 
         self.db.commit()
-        self.db.refresh(user)
         return user
 
     # -------------------
     # Profiles
     # -------------------
-    def get_user_profile(self, user_id: uuid.UUID) -> Optional[UserProfileResponse]:
-        profile = (
-            self.db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        )
-        return _to_response(profile) if profile else None
+    def _get_profile(self, user_id: uuid.UUID) -> Optional[UserProfile]:
+        if user_id not in self._profile_cache:
+            self._profile_cache[user_id] = (
+                self.db.query(UserProfile)
+                .filter(UserProfile.user_id == user_id)
+                .first()
+            )
+        return self._profile_cache[user_id]
 
-    def get_contact_profile(self, user_id: uuid.UUID) -> Optional[UserProfileResponse]:
-        return self.get_user_profile(user_id)
+    def _profile_upsert_supported(self) -> bool:
+        global _PROFILE_UPSERT_SUPPORTED
+        if _PROFILE_UPSERT_SUPPORTED is None:
+            _PROFILE_UPSERT_SUPPORTED = (
+                self.db.execute(_USER_ID_UNIQUE_SQL).first() is not None
+            )
+        return _PROFILE_UPSERT_SUPPORTED
 
-    def create_user_profile(
-        self, user_id: uuid.UUID, profile_data: UserProfileCreate
+    def _save_profile(
+        self, user_id: uuid.UUID, data: Dict[str, Any]
     ) -> UserProfileResponse:
-        profile = (
-            self.db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        )
-        if profile:
-            for field, value in profile_data.model_dump(exclude_unset=True).items():
-                setattr(profile, field, value)
-            profile.updated_at = datetime.utcnow()
-        else:
-            profile = UserProfile(
-                user_id=user_id,
-                **profile_data.model_dump(exclude_unset=True),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+        now = datetime.utcnow()
+        if not self._profile_upsert_supported():
+            return self._save_profile_unindexed(user_id, data, now)
+
+        # Single INSERT ... ON CONFLICT (user_id) DO UPDATE, no read first
+        stmt = (
+            insert(UserProfile)
+            .values(user_id=user_id, **data, created_at=now, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[UserProfile.user_id],
+                set_={**data, "updated_at": now},
             )
-            self.db.add(profile)
+            .returning(UserProfile)
+        )
+        profile = self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
         self.db.commit()
-        self.db.refresh(profile)
+        self._profile_cache[user_id] = profile
         return _to_response(profile)
 
-    def create_contact_profile(
-        self, user_id: uuid.UUID, profile_data: UserContactProfileCreate
+    def _save_profile_unindexed(
+        self, user_id: uuid.UUID, data: Dict[str, Any], now: datetime
     ) -> UserProfileResponse:
-        profile = (
-            self.db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        )
+        """Read-then-write save for databases without the user_id unique index."""
+        profile = self._get_profile(user_id)
         if profile:
-            for field, value in profile_data.model_dump(exclude_unset=True).items():
+            for field, value in data.items():
                 setattr(profile, field, value)
-            profile.updated_at = datetime.utcnow()
+            profile.updated_at = now
         else:
             profile = UserProfile(
-                user_id=user_id,
-                **profile_data.model_dump(exclude_unset=True),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                user_id=user_id, **data, created_at=now, updated_at=now
             )
             self.db.add(profile)
+            # Assign the serial id now; the response is built from this row
+            self.db.flush()
 
         self.db.commit()
-        self.db.refresh(profile)
+        self._profile_cache[user_id] = profile
         return _to_response(profile)
+
+    def get_user_profile(self, user_id: uuid.UUID) -> Optional[UserProfileResponse]:
+        profile = self._get_profile(user_id)
+        return _to_response(profile) if profile else None
+
+    def get_contact_profile(self, user_id: uuid.UUID) -> Optional[UserProfileResponse]:
+        return self.get_user_profile(user_id)
+
+    def create_user_profile(
+        self, user_id: uuid.UUID, profile_data: UserProfileCreate
+    ) -> UserProfileResponse:
+        return self._save_profile(user_id, profile_data.model_dump(exclude_unset=True))
+
+    def create_contact_profile(
+        self, user_id: uuid.UUID, profile_data: UserContactProfileCreate
+    ) -> UserProfileResponse:
+        return self._save_profile(user_id, profile_data.model_dump(exclude_unset=True))
@@ -1,8 +1,11 @@
+import base64
+import os
 import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, and_
+from sqlalchemy import desc, asc, and_, or_, func, insert, select, tuple_, update
 from fastapi import HTTPException
 from urllib.parse import urlparse
 
@@ -10,6 +13,47 @@ from app.models.website import Website
 from app.models.campaign import Campaign
 from app.schemas.website import WebsiteCreate, WebsiteUpdate, WebsiteResponse
 
+# Rows per INSERT statement when bulk importing
+_IMPORT_CHUNK_SIZE = 1000
+
+
+@lru_cache(maxsize=65536)
+def _domain_of(url: str) -> str:
+    """Netloc of a URL; memoised since imports repeat the same hosts."""
+    if "//" not in url:
+        # urlparse only finds a netloc after "//"; bare hosts have none
+        return ""
+    return urlparse(url).netloc
+
+
+def _uuid4_batch(count: int) -> List[uuid.UUID]:
+    """``count`` random (version 4) UUIDs from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [
+        uuid.UUID(bytes=raw[i : i + 16], version=4) for i in range(0, 16 * count, 16)
+    ]
+
+
+def _encode_cursor(website: Website) -> str:
+    """Opaque page cursor for the (created_at, id) of the last row served.
+
+    A NULL created_at is encoded as an empty timestamp, leaving only the id.
+    """
+    created_at = website.created_at.isoformat() if website.created_at else ""
+    raw = f"{created_at}|{website.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[Optional[datetime], uuid.UUID]:
+    try:
+        created_at, website_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            uuid.UUID(website_id),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 class WebsiteService:
     """Service for managing websites and form detection"""
@@ -18,40 +62,36 @@ class WebsiteService:
         self.db = db
 
     def create_website(
-        self, user_id: uuid.UUID, website_data: WebsiteCreate
+        self, user_id: uuid.UUID, website_data: WebsiteCreate, refresh: bool = False
     ) -> Website:
-        """Create a new website entry"""
-        # Verify campaign belongs to user
-        campaign = (
-            self.db.query(Campaign)
-            .filter(
-                and_(
-                    Campaign.id == website_data.campaign_id, Campaign.user_id == user_id
-                )
-            )
-            .first()
-        )
+        """Create a new website entry.
 
-        if not campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
+        The returned object is complete without a reload: id and the
+        timestamps are set client-side. Pass ``refresh=True`` only to re-read
+        the row from the database.
+        """
+        # Verify campaign belongs to user
+        self._assert_campaign_owned(website_data.campaign_id, user_id)
 
         # Extract domain from contact URL if not provided
         domain = website_data.domain
         if not domain and website_data.contact_url:
-            parsed = urlparse(website_data.contact_url)
-            domain = parsed.netloc
+            domain = _domain_of(website_data.contact_url)
 
         website = Website(
+            id=uuid.uuid4(),
             campaign_id=website_data.campaign_id,
             user_id=user_id,
             domain=domain,
             contact_url=website_data.contact_url,
             status="pending",
+            created_at=datetime.utcnow(),
         )
 
         self.db.add(website)
         self.db.commit()
-        self.db.refresh(website)
+        if refresh:
+            self.db.refresh(website)
         return website
 
     def get_website(
@@ -73,14 +113,7 @@ class WebsiteService:
     ) -> tuple[List[Website], int]:
         """Get websites for a campaign"""
         # Verify campaign belongs to user
-        campaign = (
-            self.db.query(Campaign)
-            .filter(and_(Campaign.id == campaign_id, Campaign.user_id == user_id))
-            .first()
-        )
-
-        if not campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
+        self._assert_campaign_owned(campaign_id, user_id)
 
         query = (
             self.db.query(Website)
@@ -93,21 +126,89 @@ class WebsiteService:
 
         return websites, total
 
-    def update_website(
-        self, website_id: uuid.UUID, user_id: uuid.UUID, website_data: WebsiteUpdate
-    ) -> Optional[Website]:
-        """Update a website"""
-        website = self.get_website(website_id, user_id)
-        if not website:
-            return None
+    def get_campaign_websites_after(
+        self,
+        campaign_id: uuid.UUID,
+        user_id: uuid.UUID,
+        cursor: Optional[str] = None,
+        per_page: int = 10,
+    ) -> tuple[List[Website], Optional[str]]:
+        """Get a page of websites for a campaign by keyset, newest first.
 
-        update_data = website_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(website, field, value)
+        Rows without a created_at come last. Pass the returned cursor back to
+        fetch the next page; it is None on the last page.
+        """
+        # Ownership is enforced by the join; no separate campaign lookup
+        query = (
+            self.db.query(Website)
+            .join(Campaign, Campaign.id == Website.campaign_id)
+            .filter(Website.campaign_id == campaign_id, Campaign.user_id == user_id)
+        )
 
-        website.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(website)
+        # Seek past the previous page instead of OFFSET-scanning to it
+        if cursor:
+            created_at, website_id = _decode_cursor(cursor)
+            if created_at is None:
+                # Already into the NULL tail; only the id orders it
+                query = query.filter(
+                    Website.created_at.is_(None), Website.id < website_id
+                )
+            else:
+                # Row comparison is NULL for NULL created_at, so add them back
+                query = query.filter(
+                    or_(
+                        tuple_(Website.created_at, Website.id)
+                        < (created_at, website_id),
+                        Website.created_at.is_(None),
+                    )
+                )
+
+        websites = (
+            query.order_by(desc(Website.created_at).nulls_last(), desc(Website.id))
+            .limit(per_page + 1)
+            .all()
+        )
+
+        if not websites:
+            # Only an empty page needs to tell "no rows" from "not yours"
+            self._assert_campaign_owned(campaign_id, user_id)
+
+        next_cursor = None
+        if len(websites) > per_page:
+            websites = websites[:per_page]
+            next_cursor = _encode_cursor(websites[-1])
+
+        return websites, next_cursor
+
+    def _assert_campaign_owned(self, campaign_id: uuid.UUID, user_id: uuid.UUID):
+        """Raise 404 unless the campaign exists and belongs to the user."""
+        exists = self.db.query(
+            select(Campaign.id)
+            .where(Campaign.id == campaign_id, Campaign.user_id == user_id)
+            .exists()
+        ).scalar()
+
+        if not exists:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+    def update_website(
+        self,
+        website_id: uuid.UUID,
+        user_id: uuid.UUID,
+        website_data: WebsiteUpdate,
+        refresh: bool = False,
+    ) -> Optional[Website]:
+        """Update a website; ``refresh=True`` re-reads the row afterwards"""
+        update_data = website_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_website(website_id, user_id)
+
+        # Ownership check, update and read-back in one UPDATE ... RETURNING
+        website = self._update_returning(
+            website_id, Website.user_id == user_id, **update_data
+        )
+        if website and refresh:
+            self.db.refresh(website)
         return website
 
     def mark_form_detected(
@@ -120,37 +221,58 @@ class WebsiteService:
         captcha_type: str = None,
     ) -> Website:
         """Mark that a form was detected on a website"""
-        website = self.db.query(Website).filter(Website.id == website_id).first()
-        if not website:
-            raise HTTPException(status_code=404, detail="Website not found")
-
-        website.form_detected = True
-        website.form_type = form_type
-        website.form_labels = form_labels
-        website.form_field_count = field_count
-        website.has_captcha = has_captcha
-        website.captcha_type = captcha_type
-        website.status = "analyzed"
-        website.updated_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(website)
-        return website
+        return self._mark_website(
+            website_id,
+            form_detected=True,
+            form_type=form_type,
+            form_labels=form_labels,
+            form_field_count=field_count,
+            has_captcha=has_captcha,
+            captcha_type=captcha_type,
+            status="analyzed",
+        )
 
     def mark_website_failed(
         self, website_id: uuid.UUID, failure_reason: str
     ) -> Website:
         """Mark a website as failed with reason"""
-        website = self.db.query(Website).filter(Website.id == website_id).first()
-        if not website:
-            raise HTTPException(status_code=404, detail="Website not found")
+        return self._mark_website(
+            website_id, status="failed", failure_reason=failure_reason
+        )
 
-        website.status = "failed"
-        website.failure_reason = failure_reason
-        website.updated_at = datetime.utcnow()
+    def bulk_mark_results(self, results: List[Dict[str, Any]]) -> int:
+        """Apply many per-website result updates in one executemany.
+
+        Each dict carries the website ``id`` plus the columns to set, e.g.
+        ``{"id": ..., "status": "failed", "failure_reason": "..."}``.
+        """
+        if not results:
+            return 0
+
+        # ORM bulk UPDATE by primary key; rows sharing a key set are batched
+        self.db.execute(update(Website), results)
+        self.db.commit()
+        return len(results)
+
+    def _update_returning(
+        self, website_id: uuid.UUID, *criteria, **values
+    ) -> Optional[Website]:
+        """UPDATE one website and read it back in the same round-trip."""
+        website = self.db.scalars(
+            update(Website)
+            .where(Website.id == website_id, *criteria)
+            .values(**values)
+            .returning(Website),
+            execution_options={"populate_existing": True},
+        ).one_or_none()
 
         self.db.commit()
-        self.db.refresh(website)
+        return website
+
+    def _mark_website(self, website_id: uuid.UUID, **values) -> Website:
+        website = self._update_returning(website_id, **values)
+        if not website:
+            raise HTTPException(status_code=404, detail="Website not found")
         return website
 
     def get_websites_by_status(self, user_id: uuid.UUID, status: str) -> List[Website]:
@@ -161,6 +283,20 @@ class WebsiteService:
             .all()
         )
 
+    def iter_websites_by_status(
+        self, user_id: uuid.UUID, status: str
+    ) -> Iterator[Website]:
+        """Stream websites by status, fetched 1000 rows at a time.
+
+        Rows come from a server-side cursor, so memory stays bounded however
+        many match. Use get_websites_by_status when a list is needed.
+        """
+        yield from self.db.scalars(
+            select(Website)
+            .where(and_(Website.user_id == user_id, Website.status == status))
+            .execution_options(yield_per=1000)
+        )
+
     def bulk_import_websites(
         self,
         user_id: uuid.UUID,
@@ -168,43 +304,50 @@ class WebsiteService:
         website_data: List[Dict[str, Any]],
     ) -> List[Website]:
         """Bulk import websites from CSV or other source"""
-        # Verify campaign belongs to user
-        campaign = (
-            self.db.query(Campaign)
-            .filter(and_(Campaign.id == campaign_id, Campaign.user_id == user_id))
-            .first()
-        )
-
-        if not campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
 
-        websites = []
-        for data in website_data:
+        def _row(data: Dict[str, Any], website_id: uuid.UUID) -> Dict[str, Any]:
             # Extract domain from URL if needed
             contact_url = data.get("contact_url") or data.get("url")
             domain = data.get("domain")
 
             if not domain and contact_url:
-                parsed = urlparse(contact_url)
-                domain = parsed.netloc
-
-            website = Website(
-                campaign_id=campaign_id,
-                user_id=user_id,
-                domain=domain,
-                contact_url=contact_url,
-                status="pending",
-            )
-            websites.append(website)
-
-        self.db.add_all(websites)
+                domain = _domain_of(contact_url)
+
+            return {
+                # Client-side ids so nothing has to be read back per row
+                "id": website_id,
+                "campaign_id": campaign_id,
+                "user_id": user_id,
+                "domain": domain,
+                "contact_url": contact_url,
+                "status": "pending",
+            }
+
+        rows = [
+            _row(data, website_id)
+            for data, website_id in zip(website_data, _uuid4_batch(len(website_data)))
+        ]
+
+        # Verify ownership and bump the campaign's URL total in one statement
+        owned = self.db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id, Campaign.user_id == user_id)
+            .values(total_urls=func.coalesce(Campaign.total_urls, 0) + len(rows))
+            .returning(Campaign.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+
+        if owned is None:
+            self.db.rollback()
+            raise HTTPException(status_code=404, detail="Campaign not found")
 
-        # Update campaign total URLs
-        campaign.total_urls += len(websites)
+        # Bulk INSERT ... RETURNING in bounded chunks instead of per-row flushes
+        stmt = insert(Website).returning(Website)
+        websites = []
+        for start in range(0, len(rows), _IMPORT_CHUNK_SIZE):
+            chunk = rows[start : start + _IMPORT_CHUNK_SIZE]
+            websites.extend(self.db.scalars(stmt, chunk).all())
 
         self.db.commit()
 
-        for website in websites:
-            self.db.refresh(website)
-
         return websites
@@ -0,0 +1,2 @@
+# Register every model so relationships resolve when a test builds one
+import app.models  # noqa: F401
@@ -0,0 +1,145 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.user import User
+from app.schemas.admin import UserManagement
+from app.schemas.auth import UserLogin
+from app.services import auth_service
+from app.services.admin_service import AdminService
+from app.services.auth_service import (
+    AuthService,
+    _CachedUser,
+    _get_or_mint_token,
+    invalidate_cached_token,
+    invalidate_cached_user,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    auth_service._token_cache.clear()
+    auth_service._user_cache.clear()
+    yield
+    auth_service._token_cache.clear()
+    auth_service._user_cache.clear()
+
+
+@pytest.fixture
+def minted(monkeypatch):
+    """Count access tokens signed while the test runs."""
+    calls = []
+
+    def fake_create_access_token(data):
+        calls.append(data)
+        return f"token-{len(calls)}"
+
+    monkeypatch.setattr(auth_service, "create_access_token", fake_create_access_token)
+    return calls
+
+
+def _user(**overrides) -> User:
+    fields = dict(
+        id=uuid.uuid4(),
+        email="owner@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        role="user",
+        first_name="Ada",
+        last_name="Lovelace",
+        created_at=datetime(2024, 1, 1),
+        subscription_status="active",
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+# -------------------
+# Token cache
+# -------------------
+def test_token_is_signed_once_per_user(minted):
+    first = _get_or_mint_token("user-1", "owner@example.com")
+    second = _get_or_mint_token("user-1", "owner@example.com")
+
+    assert first == second
+    assert len(minted) == 1
+
+
+def test_tokens_are_cached_per_user(minted):
+    _get_or_mint_token("user-1", "owner@example.com")
+    _get_or_mint_token("user-2", "other@example.com")
+
+    assert len(minted) == 2
+
+
+def test_invalidated_token_is_signed_again(minted):
+    first = _get_or_mint_token("user-1", "owner@example.com")
+    invalidate_cached_token("user-1", "owner@example.com")
+
+    assert _get_or_mint_token("user-1", "owner@example.com") != first
+    assert len(minted) == 2
+
+
+# -------------------
+# Login user cache
+# -------------------
+@pytest.fixture
+def login_db(monkeypatch):
+    """Session stand-in for login; password checks run in-process."""
+    monkeypatch.setattr(auth_service, "_bcrypt_pool", ThreadPoolExecutor(1))
+    monkeypatch.setattr(auth_service, "verify_password", lambda plain, hashed: True)
+    db = MagicMock()
+    query = db.query.return_value
+    query.filter.return_value = query
+    query.first.return_value = _user()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_login_serves_repeat_lookups_from_cache(login_db, minted):
+    request = UserLogin(email="Owner@Example.com", password="secret")
+
+    await AuthService(login_db).login_user(request)
+    response = await AuthService(login_db).login_user(request)
+
+    assert login_db.query.call_count == 1
+    assert response.user.email == "owner@example.com"
+    assert isinstance(auth_service._user_cache["owner@example.com"], _CachedUser)
+
+
+@pytest.mark.asyncio
+async def test_invalidated_user_is_read_again(login_db, minted):
+    request = UserLogin(email="owner@example.com", password="secret")
+
+    await AuthService(login_db).login_user(request)
+    invalidate_cached_user(" Owner@Example.com ")
+    await AuthService(login_db).login_user(request)
+
+    assert login_db.query.call_count == 2
+
+
+# -------------------
+# Admin user management
+# -------------------
+@pytest.mark.parametrize("action", ["activate", "deactivate", "promote", "delete"])
+def test_manage_user_drops_cached_login_state(action, minted):
+    admin = _user(email="admin@example.com", role="admin")
+    target = _user()
+    db = MagicMock()
+    query = db.query.return_value
+    query.filter.return_value = query
+    query.first.side_effect = [admin, target]
+
+    auth_service._user_cache[target.email] = _CachedUser.from_user(target)
+    _get_or_mint_token(str(target.id), target.email)
+
+    service = AdminService(db)
+    service.log_admin_action = MagicMock()
+    service.manage_user(admin.id, UserManagement(user_id=str(target.id), action=action))
+
+    db.commit.assert_called()
+    assert target.email not in auth_service._user_cache
+    assert not auth_service._token_cache
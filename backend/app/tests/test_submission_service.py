@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import OperationalError
+
+from app.services.submission_service import SubmissionService
+
+
+def _failing_log_db():
+    """Session stand-in whose SubmissionLog insert fails."""
+    db = MagicMock()
+    db.bulk_insert_mappings.side_effect = OperationalError("INSERT", {}, None)
+    # Like a real savepoint: roll back and let the error propagate
+    db.begin_nested.return_value.__exit__.return_value = False
+    return db
+
+
+def test_failed_log_write_rolls_back_only_its_savepoint():
+    db = _failing_log_db()
+    service = SubmissionService(db)
+    service._log_buffer = [{"action": "retry"}]
+
+    service._flush_logs()
+
+    savepoint = db.begin_nested.return_value
+    savepoint.__enter__.assert_called_once()
+    exc_type = savepoint.__exit__.call_args.args[0]
+    assert exc_type is OperationalError
+    db.rollback.assert_not_called()
+    assert service._log_buffer == []
+
+
+def test_flush_with_commit_commits_after_the_savepoint():
+    db = MagicMock()
+    service = SubmissionService(db)
+    service._log_buffer = [{"action": "created"}]
+
+    service._flush_logs(commit=True)
+
+    db.bulk_insert_mappings.assert_called_once()
+    db.commit.assert_called_once()
+
+
+def test_empty_buffer_touches_nothing():
+    db = MagicMock()
+
+    SubmissionService(db)._flush_logs(commit=True)
+
+    db.begin_nested.assert_not_called()
+    db.commit.assert_not_called()
@@ -0,0 +1,117 @@
+import uuid
+from unittest.mock import MagicMock, call
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.user_profile import UserProfile
+from app.schemas.user import UserProfileCreate
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+def _profile_db(existing=None):
+    """Session stand-in: .query(...).first() finds ``existing``.
+
+    flush() gives added rows a serial id, as the database would.
+    """
+    db = MagicMock()
+    query = db.query.return_value
+    query.filter.return_value = query
+    query.first.return_value = existing
+
+    def flush():
+        for add_call in db.add.call_args_list:
+            added = add_call.args[0]
+            if added.id is None:
+                added.id = 1
+
+    db.flush.side_effect = flush
+    return db
+
+
+@pytest.fixture
+def upsert_supported(monkeypatch):
+    monkeypatch.setattr(user_service, "_PROFILE_UPSERT_SUPPORTED", True)
+
+
+@pytest.fixture
+def upsert_unsupported(monkeypatch):
+    monkeypatch.setattr(user_service, "_PROFILE_UPSERT_SUPPORTED", False)
+
+
+def test_save_profile_is_one_upsert(upsert_supported):
+    user_id = uuid.uuid4()
+    db = _profile_db()
+    db.scalars.return_value.one.return_value = UserProfile(
+        id=1, user_id=user_id, first_name="Ada"
+    )
+
+    response = UserService(db).create_user_profile(
+        user_id, UserProfileCreate(first_name="Ada")
+    )
+
+    assert response.first_name == "Ada"
+    db.query.assert_not_called()
+    db.add.assert_not_called()
+    sql = str(db.scalars.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert "RETURNING" in sql
+
+
+def test_saved_profile_is_served_without_a_read(upsert_supported):
+    user_id = uuid.uuid4()
+    db = _profile_db()
+    db.scalars.return_value.one.return_value = UserProfile(
+        id=1, user_id=user_id, first_name="Ada"
+    )
+    service = UserService(db)
+
+    service.create_user_profile(user_id, UserProfileCreate(first_name="Ada"))
+
+    assert service.get_user_profile(user_id).first_name == "Ada"
+    db.query.assert_not_called()
+
+
+def test_save_profile_without_unique_index_inserts(upsert_unsupported):
+    db = _profile_db(existing=None)
+
+    response = UserService(db).create_user_profile(
+        uuid.uuid4(), UserProfileCreate(first_name="Ada")
+    )
+
+    db.scalars.assert_not_called()
+    added = db.add.call_args.args[0]
+    assert isinstance(added, UserProfile)
+    assert added.first_name == "Ada"
+    # Flushed before commit, so the id never depends on expire-on-commit
+    assert db.method_calls.index(call.flush()) < db.method_calls.index(call.commit())
+    assert response.id == 1
+
+
+def test_save_profile_without_unique_index_updates(upsert_unsupported):
+    user_id = uuid.uuid4()
+    existing = UserProfile(id=1, user_id=user_id, first_name="Old", last_name="Kept")
+    db = _profile_db(existing=existing)
+
+    response = UserService(db).create_user_profile(
+        user_id, UserProfileCreate(first_name="Ada")
+    )
+
+    db.scalars.assert_not_called()
+    db.add.assert_not_called()
+    assert (response.first_name, response.last_name) == ("Ada", "Kept")
+    assert existing.updated_at is not None
+
+
+def test_unique_index_check_runs_once_per_process(monkeypatch):
+    monkeypatch.setattr(user_service, "_PROFILE_UPSERT_SUPPORTED", None)
+    db = _profile_db()
+    db.execute.return_value.first.return_value = None
+
+    service = UserService(db)
+    service.create_user_profile(uuid.uuid4(), UserProfileCreate(first_name="A"))
+    service.create_user_profile(uuid.uuid4(), UserProfileCreate(first_name="B"))
+
+    db.execute.assert_called_once()
+    assert user_service._PROFILE_UPSERT_SUPPORTED is False
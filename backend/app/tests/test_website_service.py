@@ -0,0 +1,173 @@
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.models.website import Website
+from app.services.website_service import (
+    WebsiteService,
+    _decode_cursor,
+    _encode_cursor,
+)
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _website(created_at=None) -> Website:
+    return Website(id=uuid.uuid4(), created_at=created_at)
+
+
+def _query_db(rows):
+    """Session stand-in whose query chain returns ``rows`` from .all()."""
+    db = MagicMock()
+    query = db.query.return_value
+    for method in ("join", "filter", "order_by", "offset", "limit"):
+        getattr(query, method).return_value = query
+    query.all.return_value = rows
+    query.count.return_value = len(rows)
+    return db, query
+
+
+# -------------------
+# Cursors
+# -------------------
+def test_cursor_round_trip():
+    website = _website(datetime(2024, 5, 1, 12, 30, 15, 123456))
+    assert _decode_cursor(_encode_cursor(website)) == (
+        website.created_at,
+        website.id,
+    )
+
+
+def test_cursor_without_created_at_is_id_only():
+    website = _website(None)
+    assert _decode_cursor(_encode_cursor(website)) == (None, website.id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "Zm9vfGJhcg=="])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+# -------------------
+# Page-based listing
+# -------------------
+def test_get_campaign_websites_returns_items_and_total():
+    rows = [_website(datetime(2024, 1, 1))]
+    db, query = _query_db(rows)
+    service = WebsiteService(db)
+    service._assert_campaign_owned = MagicMock()
+
+    websites, total = service.get_campaign_websites(
+        uuid.uuid4(), uuid.uuid4(), page=3, per_page=5
+    )
+
+    assert websites == rows
+    assert total == 1
+    query.offset.assert_called_once_with(10)
+    query.limit.assert_called_once_with(5)
+
+
+# -------------------
+# Keyset listing
+# -------------------
+def test_keyset_first_page_hands_back_cursor_of_last_row():
+    rows = [_website(datetime(2024, 1, day)) for day in (3, 2, 1)]
+    db, query = _query_db(rows)
+
+    websites, next_cursor = WebsiteService(db).get_campaign_websites_after(
+        uuid.uuid4(), uuid.uuid4(), per_page=2
+    )
+
+    assert websites == rows[:2]
+    assert _decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+    query.limit.assert_called_once_with(3)
+
+    order = [_sql(clause) for clause in query.order_by.call_args.args]
+    assert order == ["websites.created_at DESC NULLS LAST", "websites.id DESC"]
+
+
+def test_keyset_last_page_has_no_cursor():
+    rows = [_website(datetime(2024, 1, 1))]
+    db, _ = _query_db(rows)
+
+    websites, next_cursor = WebsiteService(db).get_campaign_websites_after(
+        uuid.uuid4(), uuid.uuid4(), per_page=2
+    )
+
+    assert websites == rows
+    assert next_cursor is None
+
+
+def test_keyset_seek_keeps_null_created_at_rows():
+    db, query = _query_db([])
+    service = WebsiteService(db)
+    service._assert_campaign_owned = MagicMock()
+    cursor = _encode_cursor(_website(datetime(2024, 1, 1)))
+
+    service.get_campaign_websites_after(uuid.uuid4(), uuid.uuid4(), cursor=cursor)
+
+    seek = _sql(query.filter.call_args_list[-1].args[0])
+    assert "(websites.created_at, websites.id) <" in seek
+    assert "websites.created_at IS NULL" in seek
+
+
+def test_keyset_seek_within_null_tail_orders_by_id():
+    rows = [_website(None), _website(None)]
+    db, query = _query_db(rows)
+    cursor = _encode_cursor(_website(None))
+
+    websites, next_cursor = WebsiteService(db).get_campaign_websites_after(
+        uuid.uuid4(), uuid.uuid4(), cursor=cursor, per_page=1
+    )
+
+    seek = [_sql(clause) for clause in query.filter.call_args_list[-1].args]
+    assert seek[0] == "websites.created_at IS NULL"
+    assert seek[1].startswith("websites.id <")
+    assert _decode_cursor(next_cursor) == (None, rows[0].id)
+
+
+def test_keyset_empty_page_checks_ownership():
+    db, _ = _query_db([])
+    service = WebsiteService(db)
+    service._assert_campaign_owned = MagicMock(
+        side_effect=HTTPException(status_code=404, detail="Campaign not found")
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        service.get_campaign_websites_after(uuid.uuid4(), uuid.uuid4())
+    assert exc.value.status_code == 404
+
+
+# -------------------
+# Listing by status
+# -------------------
+def test_get_websites_by_status_returns_list():
+    rows = [_website(), _website()]
+    db, _ = _query_db(rows)
+
+    websites = WebsiteService(db).get_websites_by_status(uuid.uuid4(), "failed")
+
+    assert isinstance(websites, list)
+    assert websites == rows
+
+
+def test_iter_websites_by_status_streams_in_batches():
+    rows = [_website(), _website()]
+    db = MagicMock()
+    db.scalars.return_value = iter(rows)
+
+    stream = WebsiteService(db).iter_websites_by_status(uuid.uuid4(), "pending")
+
+    # Nothing is fetched until the stream is consumed
+    db.scalars.assert_not_called()
+    assert list(stream) == rows
+    stmt = db.scalars.call_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == 1000
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import itertools
+import random
+import re
+
 # User agent strings for browser automation
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-]
+)
+
+# Shuffled once at import; rotating through it needs no RNG per context
+_UA_CYCLE = itertools.cycle(random.sample(USER_AGENTS, len(USER_AGENTS)))
+
+
+def next_user_agent() -> str:
+    """Next user agent in the rotation."""
+    return next(_UA_CYCLE)
+
 
 # Browser arguments for stealth mode
-BROWSER_ARGS = [
+BROWSER_ARGS = (
     "--disable-blink-features=AutomationControlled",
     "--disable-dev-shm-usage",
     "--no-sandbox",
@@ -19,7 +32,7 @@ BROWSER_ARGS = [
     "--disable-default-apps",
     "--disable-setuid-sandbox",
     "--disable-gpu",
-]
+)
 
 # Form field patterns for detection
 FORM_FIELD_PATTERNS = {
@@ -78,6 +91,17 @@ FORM_FIELD_PATTERNS = {
     ],
 }
 
+# Every field selector as one union, so a single DOM walk finds all candidates;
+# SELECTOR_TO_FIELD classifies a hit (first field listing a selector wins)
+ALL_FIELD_SELECTOR = ", ".join(
+    dict.fromkeys(sel for sels in FORM_FIELD_PATTERNS.values() for sel in sels)
+)
+SELECTOR_TO_FIELD = {}
+for _field, _selectors in FORM_FIELD_PATTERNS.items():
+    for _selector in _selectors:
+        SELECTOR_TO_FIELD.setdefault(_selector, _field)
+del _field, _selectors, _selector
+
 # Contact form indicators
 CONTACT_FORM_INDICATORS = [
     "contact",
@@ -125,6 +149,17 @@ ERROR_INDICATORS = [
     "incorrect",
 ]
 
+
+def _any_of(needles) -> re.Pattern:
+    """One case-insensitive pattern matching any needle, for a single-pass scan."""
+    return re.compile("|".join(map(re.escape, needles)), re.IGNORECASE)
+
+
+# Compiled forms of the indicator lists above; search() replaces looping `in`
+CONTACT_FORM_INDICATOR_RE = _any_of(CONTACT_FORM_INDICATORS)
+SUCCESS_INDICATOR_RE = _any_of(SUCCESS_INDICATORS)
+ERROR_INDICATOR_RE = _any_of(ERROR_INDICATORS)
+
 # Submit button selectors
 SUBMIT_BUTTON_SELECTORS = [
     'button[type="submit"]',
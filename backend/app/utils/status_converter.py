@@ -20,6 +20,18 @@ class StatusConverter:
         "retrying": SubmissionStatus.PROCESSING,
     }
 
+    # Every enum value and alias, in the spellings callers actually send
+    _LOOKUP = {
+        spelling: status
+        for name, status in {
+            **{member.value: member for member in SubmissionStatus},
+            **STATUS_MAPPING,
+        }.items()
+        for spelling in (name, name.lower(), name.upper())
+    }
+    # Members map to themselves so enums take the same lookup as strings
+    _LOOKUP.update({member: member for member in SubmissionStatus})
+
     @classmethod
     def to_enum(cls, status: Union[str, SubmissionStatus]) -> SubmissionStatus:
         """
@@ -31,22 +43,16 @@ class StatusConverter:
         Returns:
             SubmissionStatus enum
         """
-        if isinstance(status, SubmissionStatus):
-            return status
-
-        # Try lowercase mapping first
-        status_lower = status.lower() if status else "pending"
-        if status_lower in cls.STATUS_MAPPING:
-            return cls.STATUS_MAPPING[status_lower]
-
-        # Try uppercase mapping
-        status_upper = status.upper() if status else "PENDING"
-        if status_upper in cls.STATUS_MAPPING:
-            return cls.STATUS_MAPPING[status_upper]
-
-        # Try direct enum creation
-        try:
-            return SubmissionStatus(status_upper)
-        except ValueError:
+        # Enums and exact, lower- or upper-case spellings resolve in one lookup
+        converted = cls._LOOKUP.get(status)
+        if converted is not None:
+            return converted
+        if not status:
+            return SubmissionStatus.PENDING
+
+        # Mixed case is rare enough to pay for the lower() here
+        converted = cls._LOOKUP.get(status.lower())
+        if converted is None:
             logger.warning(f"Invalid status '{status}', defaulting to PENDING")
             return SubmissionStatus.PENDING
+        return converted
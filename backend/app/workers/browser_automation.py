@@ -2,13 +2,15 @@
 """Enhanced browser automation with Windows compatibility and user profile integration."""
 
 import re
+import atexit
 import logging
 import os
 import asyncio
 import base64
 import sys
-import subprocess
-from typing import Dict, List, Optional, Any
+import httpx
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set
 from urllib.parse import urlparse, urljoin
 from sqlalchemy.orm import Session
 
@@ -32,10 +34,513 @@ from playwright.async_api import (
 
 from app.services.log_service import LogService
 from app.services.captcha_service import CaptchaService
-from app.core.database import SessionLocal
+from app.core.config import get_settings
+from app.core.database import WorkerSessionLocal
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Settings are immutable for the life of the process, so the log payload is too
+_BROWSER_LOG_SETTINGS = settings.browser.log_settings()
+
+# Campaign log events below this level are kept in LogService's buffer and
+# streams but not echoed to the console
+_LOG_LEVEL = getattr(logging, str(settings.LOG_LEVEL).upper(), logging.INFO)
+
+# Windows-specific browser args for better compatibility
+_BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-blink-features=AutomationControlled",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+)
+
+# Read-only new_context() options shared by every context. The viewport stays a
+# plain dict because Playwright sends it over the wire as-is; headers are
+# converted to a list by Playwright before sending.
+_CONTEXT_KWARGS = MappingProxyType(
+    {
+        "viewport": {"width": 1280, "height": 720},
+        "ignore_https_errors": True,
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "extra_http_headers": MappingProxyType(
+            {
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+            }
+        ),
+    }
+)
+
+# Stylesheets stay: without them honeypot fields and hidden success banners
+# would look visible to the fill and success checks
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+_BLOCKED_HOSTS = frozenset(
+    {
+        "doubleclick.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+        "facebook.net",
+        "hotjar.com",
+        "segment.com",
+        "segment.io",
+    }
+)
+
+
+def _is_blocked_host(url: str) -> bool:
+    """True when the URL's host or any parent domain is on the blocklist."""
+    labels = (urlparse(url).hostname or "").split(".")
+    return any(".".join(labels[i:]) in _BLOCKED_HOSTS for i in range(len(labels) - 1))
+
+
+# Second-level labels that sit under a country TLD (example.co.uk, foo.com.au)
+_SECOND_LEVEL_LABELS = frozenset({"ac", "co", "com", "edu", "gov", "net", "org"})
+
+
+def _site_key(url: str) -> str:
+    """Approximate registrable domain (eTLD+1) used to group same-site URLs."""
+    host = urlparse(url if "//" in url else f"//{url}").hostname or url
+    labels = host.split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+async def _route_subresources(route):
+    """Abort non-essential requests; CAPTCHA images are still needed to solve."""
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        and "captcha" not in request.url.lower()
+    ) or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _route_captcha_images(route):
+    """Page route added once a CAPTCHA is found: let its images through."""
+    request = route.request
+    if request.resource_type == "image" and not _is_blocked_host(request.url):
+        await route.continue_()
+    else:
+        # Everything else keeps the context's blocking rules
+        await route.fallback()
+
+
+# Applied once per document; the symbol guard keeps a second injection (e.g.
+# a retried add_init_script) from redefining the same properties
+_STEALTH_SCRIPT = """
+(() => {
+    const guard = Symbol.for('cps.stealth');
+    if (window[guard]) {
+        return;
+    }
+    Object.defineProperty(window, guard, { value: true });
+    const define = (name, value) =>
+        Object.defineProperty(navigator, name, { get: () => value });
+    define('webdriver', undefined);
+    define('plugins', [1, 2, 3, 4, 5]);
+    define('languages', ['en-US', 'en']);
+    define('permissions', {
+        query: () => Promise.resolve({ state: 'granted' })
+    });
+    window.chrome = { runtime: {} };
+})();
+"""
+
+# Check for contact indicators
+_CONTACT_INDICATORS = (
+    "contact",
+    "message",
+    "inquiry",
+    "email",
+    "send",
+    "submit",
+    "get in touch",
+    "reach out",
+    "talk to us",
+)
+
+_MATCH_CONTACT_FORMS_JS = """
+(forms, indicators) => forms.map((form) => {
+    const html = form.innerHTML.toLowerCase();
+    return indicators.some((indicator) => html.includes(indicator));
+})
+"""
+
+# Success patterns
+_SUCCESS_PATTERNS = (
+    "thank you",
+    "thanks",
+    "success",
+    "successfully",
+    "submitted",
+    "received",
+    "message sent",
+    "we'll get back",
+    "we will get back",
+    "we'll be in touch",
+    "we will be in touch",
+    "your message has been sent",
+    "form submitted",
+    "submission received",
+)
+
+# Check for success-indicating elements
+_SUCCESS_SELECTORS = (
+    ".success",
+    ".alert-success",
+    ".message-success",
+    '[class*="success"]',
+    '[id*="success"]',
+)
+
+_DETECT_SUCCESS_JS = """
+([patterns, selector]) => {
+    const text = (document.body ? document.body.innerText : '').toLowerCase();
+    const pattern = patterns.find((p) => text.includes(p));
+    if (pattern) {
+        return pattern;
+    }
+    for (const el of document.querySelectorAll(selector)) {
+        const elText = (el.innerText || '').trim();
+        if (elText && el.getClientRects().length) {
+            return 'success_element:' + elText.slice(0, 50);
+        }
+    }
+    return null;
+}
+"""
+
+# Resolves once the submit visibly landed: the form is gone or a success/alert
+# element with text is on screen
+_SUBMIT_OUTCOME_JS = """
+() => {
+    if (!document.querySelector('form')) {
+        return true;
+    }
+    const selector = '.success, .alert-success, .thank-you, [role="alert"]';
+    return [...document.querySelectorAll(selector)].some(
+        (el) => el.getClientRects().length && (el.innerText || '').trim()
+    );
+}
+"""
+
+# (field, selectors, user_data key); a None key is the composed full name
+_FIELD_SELECTORS = (
+    (
+        "email",
+        (
+            'input[type="email"]',
+            'input[name*="email" i]',
+            'input[id*="email" i]',
+            'input[placeholder*="email" i]',
+        ),
+        "email",
+    ),
+    (
+        "first_name",
+        (
+            'input[name*="first" i]',
+            'input[id*="first" i]',
+            'input[placeholder*="first" i]',
+        ),
+        "first_name",
+    ),
+    (
+        "last_name",
+        (
+            'input[name*="last" i]',
+            'input[id*="last" i]',
+            'input[placeholder*="last" i]',
+        ),
+        "last_name",
+    ),
+    (
+        "full_name",
+        (
+            'input[name*="name" i]:not([name*="first" i]):not([name*="last" i])',
+            'input[id*="name" i]:not([id*="first" i]):not([id*="last" i])',
+            'input[placeholder*="name" i]:not([placeholder*="first" i]):not([placeholder*="last" i])',
+        ),
+        None,
+    ),
+    (
+        "phone",
+        (
+            'input[type="tel"]',
+            'input[name*="phone" i]',
+            'input[id*="phone" i]',
+            'input[placeholder*="phone" i]',
+        ),
+        "phone_number",
+    ),
+    (
+        "company",
+        (
+            'input[name*="company" i]',
+            'input[id*="company" i]',
+            'input[placeholder*="company" i]',
+            'input[name*="organization" i]',
+        ),
+        "company_name",
+    ),
+    (
+        "job_title",
+        (
+            'input[name*="title" i]',
+            'input[id*="title" i]',
+            'input[placeholder*="title" i]',
+            'input[name*="position" i]',
+        ),
+        "job_title",
+    ),
+    (
+        "subject",
+        (
+            'input[name*="subject" i]',
+            'input[id*="subject" i]',
+            'input[placeholder*="subject" i]',
+        ),
+        "subject",
+    ),
+    (
+        "message",
+        (
+            'textarea[name*="message" i]',
+            'textarea[id*="message" i]',
+            'textarea[placeholder*="message" i]',
+            'textarea[name*="comment" i]',
+            "textarea",
+        ),
+        "message",
+    ),
+    (
+        "website",
+        (
+            'input[type="url"]',
+            'input[name*="website" i]',
+            'input[id*="website" i]',
+            'input[placeholder*="website" i]',
+        ),
+        "website_url",
+    ),
+)
+
+_FIELD_DEFAULTS = {
+    "subject": "Business Inquiry",
+    "message": "I am interested in your services and would like to discuss business opportunities.",
+}
+
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+_VALID_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$")
+
+# Strategy 3: specific sections
+_EMAIL_SECTIONS = ("footer", ".footer", "#footer", ".contact", ".contact-info")
+
+# Collects candidates in the page, in the order the Python scan used to:
+# up to 5 mailto links, 10 body-text matches and 3 matches per section
+_EXTRACT_EMAILS_JS = """
+([source, sections]) => {
+    const pattern = new RegExp(source, 'g');
+    const scan = (text, limit) => (text.match(pattern) || []).slice(0, limit);
+    const found = [];
+    const links = document.querySelectorAll('a[href^="mailto:"]');
+    for (const link of [...links].slice(0, 5)) {
+        const href = link.getAttribute('href') || '';
+        found.push(href.replace(/mailto:/g, '').split('?')[0].trim());
+    }
+    found.push(...scan(document.body ? document.body.innerText : '', 10));
+    for (const section of sections) {
+        const el = document.querySelector(section);
+        if (el) {
+            found.push(...scan(el.innerText || '', 3));
+        }
+    }
+    return [...new Set(found)];
+}
+"""
+
+_EXCLUDED_EMAIL_PARTS = ("noreply", "no-reply", "example.com", "test@")
+
+
+def _usable_emails(emails) -> List[str]:
+    """Drop placeholder and no-reply addresses."""
+    return [
+        email
+        for email in emails
+        if not any(exclude in email.lower() for exclude in _EXCLUDED_EMAIL_PARTS)
+    ]
+
+
+# Any of these means the full CaptchaService detector is worth running
+_CAPTCHA_SELECTORS = (
+    ".g-recaptcha",
+    "#g-recaptcha",
+    "[data-sitekey]",
+    'iframe[src*="recaptcha"]',
+    'script[src*="recaptcha"]',
+    ".h-captcha",
+    "#h-captcha",
+    "[data-hcaptcha-sitekey]",
+    'iframe[src*="hcaptcha"]',
+    ".cf-turnstile",
+    "#cf-turnstile",
+    'iframe[src*="challenges.cloudflare.com"]',
+    'script[src*="challenges.cloudflare.com"]',
+    'img[src*="captcha" i]',
+    'img[alt*="captcha" i]',
+    'canvas[id*="captcha" i]',
+    ".captcha-image",
+    'input[name*="captcha" i]',
+    'input[placeholder*="captcha" i]',
+)
+
+_HAS_CAPTCHA_JS = """
+(selector) => !!(
+    window.grecaptcha ||
+    window.hcaptcha ||
+    window.turnstile ||
+    document.querySelector(selector)
+)
+"""
+
+# Images in forms (or marked as CAPTCHA) that the context route aborted are
+# requested again; resolves with how many were retried once they settle
+_RELOAD_CAPTCHA_IMAGES_JS = """
+() => Promise.all(
+    Array.from(
+        document.querySelectorAll(
+            'form img, img[id*="captcha" i], img[class*="captcha" i]'
+        )
+    )
+        .filter((img) => img.src && img.complete && img.naturalWidth === 0)
+        .map((img) => new Promise((resolve) => {
+            img.addEventListener("load", resolve, { once: true });
+            img.addEventListener("error", resolve, { once: true });
+            setTimeout(resolve, 5000);
+            img.src = img.src;
+        }))
+).then((retried) => retried.length)
+"""
+
+_SUBMIT_SELECTORS = (
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Send")',
+    'button:has-text("Submit")',
+    'button:has-text("Contact")',
+    'button:has-text("Send Message")',
+    'button:has-text("Get in Touch")',
+)
+
+# Clicks the first visible match in selector order and returns its selector.
+# :has-text() is Playwright-only, so it is emulated as a case-insensitive
+# text match the same way the CAPTCHA detector does.
+_CLICK_SUBMIT_JS = """
+(form, selectors) => {
+    for (const selector of selectors) {
+        const m = selector.match(/^(.*):has-text\\("(.*)"\\)$/);
+        const el = m
+            ? Array.from(form.querySelectorAll(m[1])).find((b) =>
+                (b.textContent || '').toLowerCase().includes(m[2].toLowerCase()))
+            : form.querySelector(selector);
+        if (el && el.getClientRects().length) {
+            el.click();
+            return selector;
+        }
+    }
+    return null;
+}
+"""
+
+# Fills the first visible, editable match for each [name, selectors, value]
+# entry inside the form. Uses the native value setter so framework-controlled
+# inputs (React, Vue) see the change, then fires input/change like fill() does.
+_FILL_FORM_JS = """
+(form, fields) => {
+    const filled = [];
+    for (const [name, selectors, value] of fields) {
+        for (const selector of selectors) {
+            let el;
+            try {
+                el = form.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            if (!el || el.disabled || el.readOnly || !el.getClientRects().length) {
+                continue;
+            }
+            const proto = el instanceof HTMLTextAreaElement
+                ? HTMLTextAreaElement.prototype
+                : HTMLInputElement.prototype;
+            el.focus();
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            filled.push(name);
+            break;
+        }
+    }
+    return filled;
+}
+"""
+
+# One Playwright driver and one Chromium per (headless, slow_mo) for the whole
+# process; every BrowserAutomation instance opens its own contexts on it.
+_SHARED: Dict[str, Any] = {"pw": None, "browsers": {}, "loop": None, "lock": None}
+
+
+def _reset_shared():
+    _SHARED.update(pw=None, browsers={}, loop=None, lock=None)
+
+
+async def shutdown_shared_browser():
+    """Close the shared browsers and stop the Playwright driver."""
+    for browser in list(_SHARED["browsers"].values()):
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing shared browser: {e}")
+
+    if _SHARED["pw"] is not None:
+        try:
+            await _SHARED["pw"].stop()
+        except Exception as e:
+            logger.warning(f"Error stopping playwright: {e}")
+
+    _reset_shared()
+
+
+@atexit.register
+def _shutdown_at_exit():
+    loop = _SHARED["loop"]
+    if loop is None or loop.is_closed() or _SHARED["pw"] is None:
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(shutdown_shared_browser(), loop).result(
+                timeout=10
+            )
+        else:
+            loop.run_until_complete(shutdown_shared_browser())
+    except Exception:
+        pass
+
 
 class BrowserAutomation:
     """Enhanced browser automation with user profile integration."""
@@ -50,11 +555,6 @@ class BrowserAutomation:
         campaign_id: Optional[str] = None,
     ):
         """Initialize browser automation with centralized config"""
-        # Get settings
-        from app.core.config import get_settings
-
-        settings = get_settings()
-
         # Use settings.browser for configuration
         # Allow overrides if explicitly provided
         self.headless = headless if headless is not None else settings.browser.headless
@@ -69,13 +569,16 @@ class BrowserAutomation:
 
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
+        # Contexts this instance opened and has not closed yet
+        self._contexts: Set[BrowserContext] = set()
+        self._owns_browser = False
 
         # Database session for user profile access
         self.db: Optional[Session] = None
+        self._profile_cache: Optional[Dict[str, Any]] = None
 
-        # Initialize CAPTCHA service with user context
-        self.captcha_service: Optional[CaptchaService] = None
+        # CAPTCHA service with user context, built on first use
+        self._captcha_service: Optional[CaptchaService] = None
 
         # Log configuration with clear visibility status
         self._log_info(
@@ -83,196 +586,198 @@ class BrowserAutomation:
             f"{'VISIBLE' if not self.headless else 'HEADLESS'} mode, "
             f"slow_mo={self.slow_mo}ms, "
             f"user_id={user_id[:8] if user_id else 'None'}",
-            browser_config=self.browser_settings.log_settings(),
+            browser_config=_BROWSER_LOG_SETTINGS,
+        )
+
+    @property
+    def captcha_service(self) -> Optional[CaptchaService]:
+        """CAPTCHA service for this user, created the first time it is needed."""
+        if self._captcha_service is None and self.db and self.user_id:
+            self._captcha_service = CaptchaService(
+                db=self.db, user_id=self.user_id, campaign_id=self.campaign_id
+            )
+            self._log_info(f"Initialized CAPTCHA service for user {self.user_id[:8]}")
+        return self._captcha_service
+
+    def _log(self, level: int, message: str, context: Dict[str, Any]):
+        """Record one campaign-scoped log event (LogService also echoes it)."""
+        LogService.append(
+            logging.getLevelName(level),
+            message,
+            user_id=self.user_id,
+            campaign_id=self.campaign_id,
+            context=context,
+            console=level >= _LOG_LEVEL,
         )
 
     def _log_info(self, message: str, **context):
         """Log info message with campaign context."""
-        LogService.info(
-            message, user_id=self.user_id, campaign_id=self.campaign_id, context=context
-        )
-        logger.info(
-            f"[Campaign {self.campaign_id[:8] if self.campaign_id else 'N/A'}] {message}"
-        )
+        self._log(logging.INFO, message, context)
 
     def _log_error(self, message: str, **context):
         """Log error message with campaign context."""
-        LogService.error(
-            message, user_id=self.user_id, campaign_id=self.campaign_id, context=context
-        )
-        logger.error(
-            f"[Campaign {self.campaign_id[:8] if self.campaign_id else 'N/A'}] {message}"
-        )
+        self._log(logging.ERROR, message, context)
 
     def _log_warning(self, message: str, **context):
         """Log warning message with campaign context."""
-        LogService.warning(
-            message, user_id=self.user_id, campaign_id=self.campaign_id, context=context
-        )
-        logger.warning(
-            f"[Campaign {self.campaign_id[:8] if self.campaign_id else 'N/A'}] {message}"
-        )
+        self._log(logging.WARNING, message, context)
 
     async def start(self):
-        """Start browser with Windows compatibility and user context."""
+        """Attach to the shared browser and set up the user context."""
         try:
             self._log_info("Starting Playwright browser automation")
 
-            # Ensure ProactorEventLoop on Windows for subprocess support
-            if sys.platform == "win32":
-                loop = asyncio.get_event_loop()
-                if not isinstance(loop, asyncio.ProactorEventLoop):
-                    self._log_warning(
-                        "Not using ProactorEventLoop, attempting to switch..."
-                    )
-                    # Create new ProactorEventLoop
-                    new_loop = asyncio.ProactorEventLoop()
-                    asyncio.set_event_loop(new_loop)
-                    loop = new_loop
-                    self._log_info(
-                        "Switched to ProactorEventLoop for Windows subprocess support"
-                    )
-
-            # Initialize database session for user profile access
-            if self.user_id:
-                self.db = SessionLocal()
-                self.captcha_service = CaptchaService(
-                    db=self.db, user_id=self.user_id, campaign_id=self.campaign_id
-                )
-                self._log_info(
-                    f"Initialized CAPTCHA service for user {self.user_id[:8]}"
+            # A running loop cannot be swapped; fail fast if it can't spawn
+            # the Playwright driver
+            if sys.platform == "win32" and not isinstance(
+                asyncio.get_running_loop(), asyncio.ProactorEventLoop
+            ):
+                raise RuntimeError(
+                    "Playwright needs a ProactorEventLoop on Windows; set "
+                    "WindowsProactorEventLoopPolicy before starting the event loop"
                 )
 
-            # Start playwright with explicit timeout
-            self._log_info("Launching Playwright...")
-            try:
-                self.playwright = await async_playwright().start()
-            except Exception as e:
-                # Fallback: Try with manual subprocess if automatic fails
-                self._log_warning(
-                    f"Standard Playwright start failed: {e}, trying alternative method"
-                )
+            # Initialize database session for user profile access
+            if self.user_id and not self.db:
+                self.db = WorkerSessionLocal()
 
-                # Alternative approach for Windows
-                if sys.platform == "win32":
-                    # Install browser if needed
-                    try:
-                        subprocess.run(
-                            ["playwright", "install", "chromium"], check=True
-                        )
-                    except:
-                        pass
-
-                    # Retry with fresh event loop
-                    self.playwright = await async_playwright().start()
-                else:
-                    raise
-
-            # Windows-specific browser args for better compatibility
-            browser_args = [
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-background-timer-throttling",
-                "--disable-renderer-backgrounding",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-            ]
+            self.browser = await self._ensure_browser()
 
-            # Additional Windows-specific args
-            if sys.platform == "win32":
-                browser_args.extend(
-                    [
-                        "--disable-gpu-sandbox",
-                        "--disable-software-rasterizer",
-                        "--disable-features=RendererCodeIntegrity",
-                    ]
-                )
+            self._log_info("Browser started successfully")
 
-            self._log_info(
-                f"Launching browser with args: {browser_args[:5]}..."
-            )  # Log first 5 args
+        except Exception as e:
+            self._log_error(f"Failed to start browser: {e}")
+            await self.cleanup()
+            raise RuntimeError(f"Browser initialization failed: {e}")
 
-            # Launch browser with timeout
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo,
-                args=browser_args,
-                timeout=30000,  # 30 second timeout
+    async def _ensure_browser(self) -> Browser:
+        """Return the process-wide browser, launching it on first use."""
+        loop = asyncio.get_running_loop()
+        key = (self.headless, self.slow_mo)
+
+        # Playwright objects are bound to the loop that created them, so a
+        # caller on a different loop gets a private browser it owns.
+        if _SHARED["loop"] is not None and _SHARED["loop"] is not loop:
+            if not _SHARED["loop"].is_closed():
+                self._log_info("Launching private browser (foreign event loop)")
+                self.playwright = await self._start_playwright()
+                self._owns_browser = True
+                return await self._launch_browser(self.playwright)
+            _reset_shared()
+
+        browser = _SHARED["browsers"].get(key)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _SHARED["lock"] is None:
+            _SHARED["loop"] = loop
+            _SHARED["lock"] = asyncio.Lock()
+
+        async with _SHARED["lock"]:
+            browser = _SHARED["browsers"].get(key)
+            if browser is not None and browser.is_connected():
+                return browser
+
+            if _SHARED["pw"] is None:
+                self._log_info("Launching Playwright...")
+                _SHARED["pw"] = await self._start_playwright()
+
+            browser = await self._launch_browser(_SHARED["pw"])
+            _SHARED["browsers"][key] = browser
+            return browser
+
+    async def _start_playwright(self) -> Playwright:
+        """Start the Playwright driver.
+
+        Chromium is installed ahead of time with
+        ``SupportiveScripts/install_browsers.py``, not on this path.
+        """
+        return await async_playwright().start()
+
+    async def _launch_browser(self, playwright: Playwright) -> Browser:
+        """Launch Chromium with the automation browser args."""
+        browser_args = list(_BROWSER_ARGS)
+
+        # Additional Windows-specific args
+        if sys.platform == "win32":
+            browser_args.extend(
+                [
+                    "--disable-gpu-sandbox",
+                    "--disable-software-rasterizer",
+                    "--disable-features=RendererCodeIntegrity",
+                ]
             )
 
-            # Create context with stealth settings
-            self.context = await self.browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                ignore_https_errors=True,
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                extra_http_headers={
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                },
-            )
+        self._log_info(
+            f"Launching browser with args: {browser_args[:5]}..."
+        )  # Log first 5 args
+
+        # Launch browser with timeout
+        return await playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=self.slow_mo,
+            args=browser_args,
+            timeout=30000,  # 30 second timeout
+        )
 
-            # Add stealth scripts
-            await self.context.add_init_script(
-                """
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-                window.chrome = { runtime: {} };
-                Object.defineProperty(navigator, 'permissions', {
-                    get: () => ({
-                        query: () => Promise.resolve({ state: 'granted' })
-                    })
-                });
-            """
-            )
+    async def _new_context(self) -> BrowserContext:
+        """Create a fresh, isolated context on the shared browser."""
+        # Create context with stealth settings
+        context = await self.browser.new_context(**_CONTEXT_KWARGS)
 
-            self._log_info("Browser started successfully")
+        # Add stealth scripts
+        await context.add_init_script(_STEALTH_SCRIPT)
+
+        # Every page opened on the context inherits these
+        context.set_default_timeout(30000)
+        context.set_default_navigation_timeout(20000)
+
+        # Skip media, fonts and trackers; forms and text are all we read
+        await context.route("**/*", _route_subresources)
+
+        self._contexts.add(context)
+        return context
 
+    async def _close_context(self, context: BrowserContext):
+        """Close a per-URL context, leaving the shared browser running."""
+        self._contexts.discard(context)
+        try:
+            await context.close()
         except Exception as e:
-            self._log_error(f"Failed to start browser: {e}")
-            await self.cleanup()
-            raise RuntimeError(f"Browser initialization failed: {e}")
+            self._log_warning(f"Error closing context: {e}")
 
     async def stop(self):
         """Stop browser and cleanup."""
         await self.cleanup()
 
     async def cleanup(self):
-        """Clean up browser resources and database connection."""
+        """Release this instance's contexts and database connection.
+
+        The shared browser stays up for the next instance; it is closed by
+        ``shutdown_shared_browser`` at process exit.
+        """
         try:
-            if self.context:
-                try:
-                    await self.context.close()
-                    self._log_info("Browser context closed")
-                except Exception as e:
-                    self._log_warning(f"Error closing context: {e}")
-                finally:
-                    self.context = None
+            for context in list(self._contexts):
+                await self._close_context(context)
 
-            if self.browser:
-                try:
-                    await self.browser.close()
-                    self._log_info("Browser closed")
-                except Exception as e:
-                    self._log_warning(f"Error closing browser: {e}")
-                finally:
-                    self.browser = None
+            if self._owns_browser:
+                if self.browser:
+                    try:
+                        await self.browser.close()
+                        self._log_info("Browser closed")
+                    except Exception as e:
+                        self._log_warning(f"Error closing browser: {e}")
 
-            if self.playwright:
-                try:
-                    await self.playwright.stop()
-                    self._log_info("Playwright stopped")
-                except Exception as e:
-                    self._log_warning(f"Error stopping playwright: {e}")
-                finally:
-                    self.playwright = None
+                if self.playwright:
+                    try:
+                        await self.playwright.stop()
+                        self._log_info("Playwright stopped")
+                    except Exception as e:
+                        self._log_warning(f"Error stopping playwright: {e}")
+
+            self.browser = None
+            self.playwright = None
+            self._owns_browser = False
 
             # Close database connection
             if self.db:
@@ -282,16 +787,29 @@ class BrowserAutomation:
                     pass
                 finally:
                     self.db = None
+                    self._captcha_service = None
 
         except Exception as e:
             self._log_warning(f"Error during cleanup: {e}")
 
-    async def process(self, url: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process website with user profile-based CAPTCHA solving and form filling."""
-        if not self.context:
+    async def process(
+        self,
+        url: str,
+        user_data: Dict[str, Any],
+        context: Optional[BrowserContext] = None,
+    ) -> Dict[str, Any]:
+        """Process website with user profile-based CAPTCHA solving and form filling.
+
+        Runs in ``context`` when given (the caller keeps ownership of it);
+        otherwise a fresh context is opened for this URL and closed afterwards.
+        """
+        if not self.browser:
             await self.start()
 
+        owns_context = context is None
+
         page = None
+        email_probe = None
         result = {
             "success": False,
             "method": "none",
@@ -305,10 +823,8 @@ class BrowserAutomation:
                 "captcha_solved": False,
                 "captcha_type": None,
                 "form_fields_filled": 0,
-                "user_has_dbc_credentials": (
-                    bool(self.captcha_service and self.captcha_service.dbc.enabled)
-                    if self.captcha_service
-                    else False
+                "user_has_dbc_credentials": bool(
+                    self._captcha_service and self._captcha_service.dbc.enabled
                 ),
             },
         }
@@ -316,17 +832,26 @@ class BrowserAutomation:
         try:
             self._log_info(f"Starting to process website: {url}")
 
-            # Create and configure page
-            page = await self.context.new_page()
-            page.set_default_timeout(30000)
+            # Fetch the raw HTML alongside navigation so the email fallback
+            # still has a source when Chromium cannot load the site
+            if settings.FEATURE_EMAIL_FALLBACK:
+                email_probe = asyncio.create_task(self._extract_emails_via_http(url))
 
-            # Clean and normalize URL
-            if not url.startswith(("http://", "https://")):
-                url = "https://" + url
+            # Fresh context per URL so cookies and storage never leak between sites
+            if owns_context:
+                context = await self._new_context()
+            page = await context.new_page()
 
-            # Navigate to main page
-            nav_success, final_url, nav_error = await self._safe_navigate(page, url)
+            # Navigate to main page (bare hosts race https against http)
+            page, nav_success, final_url, nav_error = await self._safe_navigate(
+                page, url
+            )
             if not nav_success:
+                emails = await email_probe if email_probe else []
+                if emails:
+                    self._log_info(f"Navigation failed, using fetched HTML for {url}")
+                    return self._email_result(result, emails)
+
                 result["error"] = f"Navigation failed: {nav_error}"
                 self._log_error(f"Navigation failed for {url}: {nav_error}")
                 return result
@@ -335,7 +860,7 @@ class BrowserAutomation:
             self._log_info(f"Successfully navigated to: {final_url}")
 
             # Wait for page to load and dynamic content
-            await asyncio.sleep(2)
+            await self._settle(page)
             await self._wait_for_dynamic_content(page)
 
             # Strategy 1: Try forms on current page
@@ -361,12 +886,7 @@ class BrowserAutomation:
             # Strategy 3: Email extraction fallback
             emails = await self._extract_emails_comprehensive(page)
             if emails:
-                result["success"] = True
-                result["method"] = "email"
-                result["details"]["primary_email"] = emails[0]
-                result["details"]["emails_found"] = emails[:5]
-                self._log_info(f"Email extraction successful: {emails[0]}")
-                return result
+                return self._email_result(result, emails)
 
             # No success
             result["error"] = (
@@ -379,7 +899,14 @@ class BrowserAutomation:
             self._log_error(f"Processing error for {url}: {e}")
 
         finally:
-            if page:
+            if email_probe:
+                email_probe.cancel()
+
+            # Closing the context closes its pages too
+            if owns_context:
+                if context:
+                    await self._close_context(context)
+            elif page:
                 try:
                     await page.close()
                 except Exception as e:
@@ -387,24 +914,90 @@ class BrowserAutomation:
 
         return result
 
+    async def process_many(
+        self, urls: List[str], user_data: Dict[str, Any], concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Process several websites at once, one context per site.
+
+        URLs on the same registrable domain share a context and run one after
+        another, keeping their cookies and open connections; different sites
+        run in parallel, at most ``concurrency`` at a time. Results are
+        returned in the same order as ``urls``.
+        """
+        if not self.browser:
+            await self.start()
+
+        groups: Dict[str, List[int]] = {}
+        for index, url in enumerate(urls):
+            groups.setdefault(_site_key(url), []).append(index)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _process_site(indexes: List[int]):
+            async with semaphore:
+                try:
+                    context = await self._new_context()
+                except Exception as e:
+                    # process() opens (and reports failures of) its own contexts
+                    self._log_warning(f"Could not open shared site context: {e}")
+                    context = None
+
+                try:
+                    for index in indexes:
+                        results[index] = await self.process(
+                            urls[index], user_data, context=context
+                        )
+                finally:
+                    if context:
+                        await self._close_context(context)
+
+        await asyncio.gather(*(_process_site(indexes) for indexes in groups.values()))
+        return results
+
     async def _get_user_profile_data(self) -> Dict[str, Any]:
-        """Get user profile data for form filling from database."""
+        """Get user profile data for form filling from database.
+
+        The result is cached for the life of the instance; call
+        ``refresh_profile`` to force a reload.
+        """
         if not self.db or not self.user_id:
             return {}
 
+        if self._profile_cache is not None:
+            return self._profile_cache
+
         try:
+            from sqlalchemy.orm import load_only
+
             from app.models.user_profile import UserProfile
             from app.models.user import User
 
-            # Get user basic info
-            user = self.db.query(User).filter(User.id == self.user_id).first()
-
-            # Get extended profile
-            profile = (
-                self.db.query(UserProfile)
-                .filter(UserProfile.user_id == self.user_id)
+            # User and extended profile in one query, only the columns used
+            row = (
+                self.db.query(User, UserProfile)
+                .outerjoin(UserProfile, UserProfile.user_id == User.id)
+                .filter(User.id == self.user_id)
+                .options(
+                    load_only(User.email, User.first_name, User.last_name),
+                    load_only(
+                        UserProfile.phone_number,
+                        UserProfile.company_name,
+                        UserProfile.job_title,
+                        UserProfile.website_url,
+                        UserProfile.subject,
+                        UserProfile.message,
+                        UserProfile.city,
+                        UserProfile.state,
+                        UserProfile.country,
+                        UserProfile.industry,
+                        UserProfile.dbc_username,
+                        UserProfile.dbc_password,
+                    ),
+                )
                 .first()
             )
+            user, profile = row if row else (None, None)
 
             user_data = {}
 
@@ -449,6 +1042,7 @@ class BrowserAutomation:
             if not user_data.get("message"):
                 user_data["message"] = "I am interested in your services."
 
+            self._profile_cache = user_data
             return user_data
 
         except Exception as e:
@@ -460,32 +1054,76 @@ class BrowserAutomation:
                 "message": "I am interested in your services.",
             }
 
+    def refresh_profile(self):
+        """Drop the cached profile so the next lookup reads the database."""
+        self._profile_cache = None
+
     # ... (rest of the methods remain the same)
     async def _safe_navigate(self, page: Page, url: str):
-        """Safely navigate to URL with multiple attempts."""
-        candidates = [url]
-        if not url.startswith("http"):
-            candidates = [f"https://{url}", f"http://{url}"]
+        """Navigate to URL, racing https and http when no scheme is given.
+
+        Returns ``(page, success, final_url, error)``. The returned page is the
+        one that loaded, which is a second tab when only http answered.
+        """
+        if url.startswith(("http://", "https://")):
+            success, error = await self._goto(page, url)
+            return page, success, page.url if success else url, error
+
+        # https stays preferred; http loads speculatively in a second tab so a
+        # dead https host costs one timeout instead of two in a row
+        http_page = await page.context.new_page()
+        https_task = asyncio.create_task(self._goto(page, f"https://{url}"))
+        http_task = asyncio.create_task(self._goto(http_page, f"http://{url}"))
+        try:
+            success, error = await https_task
+            if success:
+                return page, True, page.url, None
+
+            success, http_error = await http_task
+            if success:
+                # Keep the http tab; the failed https tab is closed below
+                page, http_page = http_page, page
+                return page, True, page.url, None
 
-        last_error = None
-        for candidate in candidates:
+            return page, False, url, http_error or error
+        finally:
+            http_task.cancel()
             try:
-                self._log_info(f"Attempting navigation to: {candidate}")
-                response = await page.goto(
-                    candidate, wait_until="domcontentloaded", timeout=20000
-                )
+                await http_page.close()
+            except Exception:
+                pass
 
-                if response and response.status >= 400:
-                    last_error = f"HTTP {response.status}"
-                    continue
+    async def _goto(self, page: Page, url: str):
+        """Load one candidate URL, treating HTTP error statuses as failures."""
+        try:
+            self._log_info(f"Attempting navigation to: {url}")
+            response = await page.goto(
+                url, wait_until="domcontentloaded", timeout=20000
+            )
 
-                return True, page.url, None
+            if response and response.status >= 400:
+                return False, f"HTTP {response.status}"
 
-            except Exception as e:
-                last_error = str(e)
-                continue
+            return True, None
 
-        return False, url, last_error
+        except Exception as e:
+            return False, str(e)
+
+    async def _settle(self, page: Page, timeout: int = 3000):
+        """Wait for the network to go idle, giving up after ``timeout`` ms."""
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
+        except Exception:
+            pass
+
+    async def _wait_for_submit_outcome(self, page: Page):
+        """Wait until a success message shows, the form goes away, or 5s pass."""
+        try:
+            await page.wait_for_function(_SUBMIT_OUTCOME_JS, timeout=5000)
+        except Exception:
+            # A submit that navigates tears down the polling script (or nothing
+            # changed in time); either way let the resulting page settle
+            await self._settle(page)
 
     async def _wait_for_dynamic_content(self, page: Page):
         """Wait for dynamic forms and content to load."""
@@ -511,31 +1149,18 @@ class BrowserAutomation:
     async def _detect_forms(self, page: Page) -> List[Any]:
         """Detect all forms on the page."""
         forms = await page.query_selector_all("form")
+        if not forms:
+            return forms
 
-        # Filter for likely contact forms
-        contact_forms = []
-        for form in forms:
-            try:
-                form_html = await form.inner_html()
-                form_text = form_html.lower()
-
-                # Check for contact indicators
-                contact_indicators = [
-                    "contact",
-                    "message",
-                    "inquiry",
-                    "email",
-                    "send",
-                    "submit",
-                    "get in touch",
-                    "reach out",
-                    "talk to us",
-                ]
+        # Filter for likely contact forms in the page; only booleans come back
+        try:
+            hits = await page.eval_on_selector_all(
+                "form", _MATCH_CONTACT_FORMS_JS, list(_CONTACT_INDICATORS)
+            )
+        except Exception:
+            return forms
 
-                if any(indicator in form_text for indicator in contact_indicators):
-                    contact_forms.append(form)
-            except:
-                continue
+        contact_forms = [form for form, hit in zip(forms, hits) if hit]
 
         return contact_forms if contact_forms else forms
 
@@ -554,40 +1179,33 @@ class BrowserAutomation:
         for i, form in enumerate(forms, 1):
             self._log_info(f"Processing form {i}/{len(forms)}")
 
-            # Detect and solve CAPTCHA if present
-            captcha_solved = False
-            captcha_type = None
-
-            if self.captcha_service:
-                captcha_solved = await self.captcha_service.solve_if_present(page)
+            # Solve any CAPTCHA while the form is filled; submit waits for both
+            fill = self._fill_form_comprehensive(page, form, user_data)
+            if await self._has_captcha(page) and self.captcha_service:
+                await self._load_captcha_images(page)
+                result["details"]["user_has_dbc_credentials"] = (
+                    self.captcha_service.dbc.enabled
+                )
+                (captcha_solved, captcha_type), filled_count = await asyncio.gather(
+                    self.captcha_service.solve_if_present(page), fill
+                )
                 if captcha_solved:
                     result["details"]["captcha_solved"] = True
-                    self._log_info("CAPTCHA solved successfully")
-
-                    # Detect which type was solved for logging
-                    detected_types = await self.captcha_service.detect_captcha_types(
-                        page
-                    )
-                    for ctype, detected in detected_types.items():
-                        if detected:
-                            captcha_type = ctype
-                            break
                     result["details"]["captcha_type"] = captcha_type
+                    self._log_info("CAPTCHA solved successfully")
+            else:
+                filled_count = await fill
 
-            # Fill form
-            filled_count = await self._fill_form_comprehensive(page, form, user_data)
             result["details"]["form_fields_filled"] = filled_count
 
             if filled_count > 0:
-                self._log_info(f"Filled {filled_count} form fields")
-
                 # Submit form
                 submitted, submit_method = await self._submit_form(page, form)
                 if submitted:
                     self._log_info(f"Form submitted via {submit_method}")
 
                     # Wait and check for success
-                    await asyncio.sleep(3)
+                    await self._wait_for_submit_outcome(page)
                     success_hint = await self._detect_success_indicators(page)
 
                     result["success"] = True
@@ -602,157 +1220,68 @@ class BrowserAutomation:
 
         return result
 
+    async def _load_captcha_images(self, page: Page):
+        """Unblock images on a CAPTCHA page and retry the ones already aborted.
+
+        Image CAPTCHAs are not always served from a URL containing "captcha",
+        so the context route may have dropped the challenge image.
+        """
+        try:
+            await page.route("**/*", _route_captcha_images)
+            retried = await page.evaluate(_RELOAD_CAPTCHA_IMAGES_JS)
+            if retried:
+                self._log_info(f"Reloaded {retried} form image(s) for CAPTCHA")
+        except Exception as e:
+            self._log_warning(f"Could not reload CAPTCHA images: {e}")
+
+    async def _has_captcha(self, page: Page) -> bool:
+        """Cheap check for any CAPTCHA widget before building the solver."""
+        try:
+            return await page.evaluate(_HAS_CAPTCHA_JS, ", ".join(_CAPTCHA_SELECTORS))
+        except Exception:
+            # Let the full detector decide
+            return True
+
     async def _fill_form_comprehensive(
         self, page: Page, form: Any, user_data: Dict
     ) -> int:
         """Comprehensively fill form with user profile data."""
-        filled_count = 0
-
-        # Field mapping with multiple selectors for each field type
-        field_mappings = {
-            "email": {
-                "selectors": [
-                    'input[type="email"]',
-                    'input[name*="email" i]',
-                    'input[id*="email" i]',
-                    'input[placeholder*="email" i]',
-                ],
-                "value": user_data.get("email", ""),
-            },
-            "first_name": {
-                "selectors": [
-                    'input[name*="first" i]',
-                    'input[id*="first" i]',
-                    'input[placeholder*="first" i]',
-                ],
-                "value": user_data.get("first_name", ""),
-            },
-            "last_name": {
-                "selectors": [
-                    'input[name*="last" i]',
-                    'input[id*="last" i]',
-                    'input[placeholder*="last" i]',
-                ],
-                "value": user_data.get("last_name", ""),
-            },
-            "full_name": {
-                "selectors": [
-                    'input[name*="name" i]:not([name*="first" i]):not([name*="last" i])',
-                    'input[id*="name" i]:not([id*="first" i]):not([id*="last" i])',
-                    'input[placeholder*="name" i]:not([placeholder*="first" i]):not([placeholder*="last" i])',
-                ],
-                "value": f"{user_data.get('first_name', '')} {user_data.get('last_name', '')}".strip(),
-            },
-            "phone": {
-                "selectors": [
-                    'input[type="tel"]',
-                    'input[name*="phone" i]',
-                    'input[id*="phone" i]',
-                    'input[placeholder*="phone" i]',
-                ],
-                "value": user_data.get("phone_number", ""),
-            },
-            "company": {
-                "selectors": [
-                    'input[name*="company" i]',
-                    'input[id*="company" i]',
-                    'input[placeholder*="company" i]',
-                    'input[name*="organization" i]',
-                ],
-                "value": user_data.get("company_name", ""),
-            },
-            "job_title": {
-                "selectors": [
-                    'input[name*="title" i]',
-                    'input[id*="title" i]',
-                    'input[placeholder*="title" i]',
-                    'input[name*="position" i]',
-                ],
-                "value": user_data.get("job_title", ""),
-            },
-            "subject": {
-                "selectors": [
-                    'input[name*="subject" i]',
-                    'input[id*="subject" i]',
-                    'input[placeholder*="subject" i]',
-                ],
-                "value": user_data.get("subject", "Business Inquiry"),
-            },
-            "message": {
-                "selectors": [
-                    'textarea[name*="message" i]',
-                    'textarea[id*="message" i]',
-                    'textarea[placeholder*="message" i]',
-                    'textarea[name*="comment" i]',
-                    "textarea",
-                ],
-                "value": user_data.get(
-                    "message",
-                    "I am interested in your services and would like to discuss business opportunities.",
-                ),
-            },
-            "website": {
-                "selectors": [
-                    'input[type="url"]',
-                    'input[name*="website" i]',
-                    'input[id*="website" i]',
-                    'input[placeholder*="website" i]',
-                ],
-                "value": user_data.get("website_url", ""),
-            },
-        }
+        full_name = f"{user_data.get('first_name', '')} {user_data.get('last_name', '')}".strip()
+
+        # Fill every field type in one round-trip to the page
+        fields = []
+        for field_name, selectors, key in _FIELD_SELECTORS:
+            if key is None:
+                value = full_name
+            else:
+                value = user_data.get(key, _FIELD_DEFAULTS.get(key, ""))
+            if value:
+                fields.append([field_name, list(selectors), value])
 
-        # Fill each field type
-        for field_name, field_info in field_mappings.items():
-            if not field_info["value"]:
-                continue
+        try:
+            filled = await form.evaluate(_FILL_FORM_JS, fields)
+        except Exception as e:
+            self._log_warning(f"Form fill error: {e}")
+            return 0
 
-            for selector in field_info["selectors"]:
-                try:
-                    element = await form.query_selector(selector)
-                    if element and await element.is_visible():
-                        await element.fill(field_info["value"])
-                        filled_count += 1
-                        self._log_info(
-                            f"Filled {field_name} field with: {field_info['value'][:50]}"
-                        )
-                        break
-                except Exception as e:
-                    continue
+        if filled:
+            self._log_info(f"Filled {len(filled)} form fields: {', '.join(filled)}")
 
-        return filled_count
+        return len(filled)
 
     async def _submit_form(self, page: Page, form: Any) -> tuple[bool, str]:
         """Submit form using multiple strategies."""
         try:
-            # Strategy 1: Find and click submit button
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Send")',
-                'button:has-text("Submit")',
-                'button:has-text("Contact")',
-                'button:has-text("Send Message")',
-                'button:has-text("Get in Touch")',
-            ]
-
-            for selector in submit_selectors:
-                try:
-                    button = await form.query_selector(selector)
-                    if button and await button.is_visible():
-                        await button.click()
-
-                        # Wait for navigation or response
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                        except:
-                            pass
-
-                        await asyncio.sleep(2)
-                        return True, f"button:{selector}"
+            # Strategy 1: Find and click submit button in one evaluate
+            try:
+                selector = await form.evaluate(
+                    _CLICK_SUBMIT_JS, list(_SUBMIT_SELECTORS)
+                )
+                if selector:
+                    return True, f"button:{selector}"
 
-                except Exception:
-                    continue
+            except Exception as e:
+                self._log_warning(f"Submit button click failed: {e}")
 
             # Strategy 2: Try Enter key on last input
             try:
@@ -760,13 +1289,6 @@ class BrowserAutomation:
                 if inputs:
                     last_input = inputs[-1]
                     await last_input.press("Enter")
-
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=10000)
-                    except:
-                        pass
-
-                    await asyncio.sleep(2)
                     return True, "enter_key"
 
             except Exception:
@@ -781,56 +1303,14 @@ class BrowserAutomation:
     async def _detect_success_indicators(self, page: Page) -> Optional[str]:
         """Detect success indicators after form submission."""
         try:
-            # Wait a moment for success messages to appear
-            await asyncio.sleep(2)
-
-            # Get page content
-            content = await page.content()
-            content_lower = content.lower()
-
-            # Success patterns
-            success_patterns = [
-                "thank you",
-                "thanks",
-                "success",
-                "successfully",
-                "submitted",
-                "received",
-                "message sent",
-                "we'll get back",
-                "we will get back",
-                "we'll be in touch",
-                "we will be in touch",
-                "your message has been sent",
-                "form submitted",
-                "submission received",
-            ]
-
-            for pattern in success_patterns:
-                if pattern in content_lower:
-                    self._log_info(f"Success indicator found: {pattern}")
-                    return pattern
-
-            # Check for success-indicating elements
-            success_selectors = [
-                ".success",
-                ".alert-success",
-                ".message-success",
-                '[class*="success"]',
-                '[id*="success"]',
-            ]
-
-            for selector in success_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        text = await element.inner_text()
-                        if text and len(text.strip()) > 0:
-                            return f"success_element:{text[:50]}"
-                except:
-                    continue
-
-            return None
+            # Scan the rendered text in the page; only the hint comes back
+            hint = await page.evaluate(
+                _DETECT_SUCCESS_JS,
+                [list(_SUCCESS_PATTERNS), ", ".join(_SUCCESS_SELECTORS)],
+            )
+            if hint and not hint.startswith("success_element:"):
+                self._log_info(f"Success indicator found: {hint}")
+            return hint
 
         except Exception as e:
             self._log_error(f"Success detection error: {e}")
@@ -845,7 +1325,7 @@ class BrowserAutomation:
             await page.goto(contact_url, wait_until="domcontentloaded")
             result["details"]["pages_checked"].append(contact_url)
 
-            await asyncio.sleep(2)
+            await self._settle(page)
             await self._wait_for_dynamic_content(page)
 
             # Process forms on contact page
@@ -890,66 +1370,15 @@ class BrowserAutomation:
 
     async def _extract_emails_comprehensive(self, page: Page) -> List[str]:
         """Comprehensive email extraction."""
-        emails = set()
-
         try:
-            # Strategy 1: mailto links
-            mailto_links = await page.query_selector_all('a[href^="mailto:"]')
-            for link in mailto_links[:5]:
-                try:
-                    href = await link.get_attribute("href")
-                    if href:
-                        email = href.replace("mailto:", "").split("?")[0].strip()
-                        if self._is_valid_email(email):
-                            emails.add(email)
-                except:
-                    continue
-
-            # Strategy 2: text content scanning
-            try:
-                body_text = await page.inner_text("body")
-                email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-                found_emails = re.findall(email_pattern, body_text)
-
-                for email in found_emails[:10]:
-                    if self._is_valid_email(email):
-                        emails.add(email)
-
-            except Exception as e:
-                self._log_warning(f"Text email extraction error: {e}")
-
-            # Strategy 3: specific sections
-            email_sections = [
-                "footer",
-                ".footer",
-                "#footer",
-                ".contact",
-                ".contact-info",
-            ]
-            for section in email_sections:
-                try:
-                    element = await page.query_selector(section)
-                    if element:
-                        section_text = await element.inner_text()
-                        section_emails = re.findall(
-                            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-                            section_text,
-                        )
-                        for email in section_emails[:3]:
-                            if self._is_valid_email(email):
-                                emails.add(email)
-                except:
-                    continue
+            # mailto links, body text and contact sections in one evaluate
+            candidates = await page.evaluate(
+                _EXTRACT_EMAILS_JS, [_EMAIL_RE.pattern, list(_EMAIL_SECTIONS)]
+            )
+            emails = [email for email in candidates if self._is_valid_email(email)]
 
             # Filter and return
-            filtered_emails = [
-                email
-                for email in emails
-                if not any(
-                    exclude in email.lower()
-                    for exclude in ["noreply", "no-reply", "example.com", "test@"]
-                )
-            ]
+            filtered_emails = _usable_emails(emails)
 
             if filtered_emails:
                 self._log_info(
@@ -962,10 +1391,42 @@ class BrowserAutomation:
             self._log_error(f"Email extraction error: {e}")
             return []
 
+    async def _extract_emails_via_http(self, url: str) -> List[str]:
+        """Scan the raw HTML of ``url`` for emails without rendering it."""
+        if not url.startswith(("http://", "https://")):
+            url = f"https://{url}"
+
+        try:
+            async with httpx.AsyncClient(
+                timeout=5, follow_redirects=True, verify=False
+            ) as client:
+                response = await client.get(url)
+            if response.status_code >= 400:
+                return []
+
+            found = {
+                email
+                for email in _EMAIL_RE.findall(response.text)
+                if self._is_valid_email(email)
+            }
+            return _usable_emails(found)[:5]
+
+        except Exception as e:
+            logger.debug(f"HTTP email probe failed for {url}: {e}")
+            return []
+
+    def _email_result(self, result: Dict, emails: List[str]) -> Dict:
+        """Record a successful email-extraction outcome on ``result``."""
+        result["success"] = True
+        result["method"] = "email"
+        result["details"]["primary_email"] = emails[0]
+        result["details"]["emails_found"] = emails[:5]
+        self._log_info(f"Email extraction successful: {emails[0]}")
+        return result
+
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format."""
         if not email or len(email) > 254:
             return False
 
-        email_pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$"
-        return bool(re.match(email_pattern, email))
+        return bool(_VALID_EMAIL_RE.match(email))
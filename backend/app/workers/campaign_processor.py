@@ -8,7 +8,7 @@ import os
 from datetime import datetime
 from typing import Dict, Optional
 
-from app.core.database import SessionLocal
+from app.core.database import WorkerSessionLocal
 from app.models.campaign import Campaign, CampaignStatus
 from app.models.submission import Submission, SubmissionStatus
 from app.services.log_service import LogService
@@ -32,7 +32,9 @@ class CampaignProcessor:
         """
         self.campaign_id = str(uuid.UUID(campaign_id))
         self.user_id = user_id
-        self.db = SessionLocal()
+        # Rows loaded here are read on the loop thread after commits made on
+        # worker threads; keep their attributes instead of lazily re-SELECTing
+        self.db = WorkerSessionLocal(expire_on_commit=False)
         self.browser_automation = None
         self.stats = {
             "total": 0,
@@ -71,10 +73,10 @@ class CampaignProcessor:
             self._log("INFO", "Starting campaign processing with VISIBLE browser")
 
             # Get campaign
-            campaign = (
+            campaign = await asyncio.to_thread(
                 self.db.query(Campaign)
                 .filter(Campaign.id == uuid.UUID(self.campaign_id))
-                .first()
+                .first
             )
 
             if not campaign:
@@ -118,7 +120,8 @@ class CampaignProcessor:
                     self._log("INFO", "Forced headless=False again")
 
             # Update status
-            update_campaign_status(
+            await asyncio.to_thread(
+                update_campaign_status,
                 self.db,
                 uuid.UUID(self.campaign_id),
                 CampaignStatus.ACTIVE,
@@ -129,7 +132,9 @@ class CampaignProcessor:
             from app.services.submission_service import SubmissionService
 
             service = SubmissionService(self.db)
-            user_data = service.get_user_profile_data(campaign.user_id)
+            user_data = await asyncio.to_thread(
+                service.get_user_profile_data, campaign.user_id
+            )
 
             # Log CAPTCHA status
             has_dbc = bool(
@@ -141,12 +146,15 @@ class CampaignProcessor:
             )
 
             # Get pending submissions
-            submissions = pending_for_campaign(self.db, uuid.UUID(self.campaign_id))
+            submissions = await asyncio.to_thread(
+                pending_for_campaign, self.db, uuid.UUID(self.campaign_id)
+            )
             self.stats["total"] = len(submissions)
 
             if not submissions:
                 self._log("INFO", "No pending submissions found")
-                update_campaign_status(
+                await asyncio.to_thread(
+                    update_campaign_status,
                     self.db,
                     uuid.UUID(self.campaign_id),
                     CampaignStatus.COMPLETED,
@@ -172,7 +180,8 @@ class CampaignProcessor:
 
             # Complete campaign
             self.stats["end_time"] = datetime.utcnow()
-            update_campaign_status(
+            await asyncio.to_thread(
+                update_campaign_status,
                 self.db,
                 uuid.UUID(self.campaign_id),
                 CampaignStatus.COMPLETED,
@@ -188,7 +197,8 @@ class CampaignProcessor:
         except Exception as e:
             self.stats["end_time"] = datetime.utcnow()
             self._log("ERROR", f"Campaign processing failed: {e}")
-            update_campaign_status(
+            await asyncio.to_thread(
+                update_campaign_status,
                 self.db,
                 uuid.UUID(self.campaign_id),
                 CampaignStatus.FAILED,
@@ -202,7 +212,7 @@ class CampaignProcessor:
                     await self.browser_automation.stop()
             except:
                 pass
-            self.db.close()
+            await asyncio.to_thread(self.db.close)
 
     async def _process_submission(
         self, submission: Submission, user_data: Dict, index: int, total: int
@@ -210,7 +220,7 @@ class CampaignProcessor:
         """Process a single submission."""
         try:
             self._log("INFO", f"Processing {index}/{total}: {submission.url}")
-            mark_submission_processing(self.db, submission.id)
+            await asyncio.to_thread(mark_submission_processing, self.db, submission.id)
 
             # Process website with user-specific data and CAPTCHA credentials
             result = await self.browser_automation.process(submission.url, user_data)
@@ -228,7 +238,8 @@ class CampaignProcessor:
                     f"CAPTCHA solved for {submission.url} (type: {details.get('captcha_type')})",
                 )
 
-            mark_submission_result(
+            await asyncio.to_thread(
+                mark_submission_result,
                 self.db,
                 submission.id,
                 success=success,
@@ -249,8 +260,12 @@ class CampaignProcessor:
         except Exception as e:
             self.stats["failed"] += 1
             self._log("ERROR", f"Processing error for {submission.url}: {e}")
-            mark_submission_result(
-                self.db, submission.id, success=False, error_message=str(e)[:500]
+            await asyncio.to_thread(
+                mark_submission_result,
+                self.db,
+                submission.id,
+                success=False,
+                error_message=str(e)[:500],
             )
 
     def _log_summary(self):
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from typing import Optional, List
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -98,20 +99,22 @@ def update_campaign_status(
 ) -> bool:
     """Update campaign status."""
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        # Unknown fields are ignored, as before
+        columns = Campaign.__mapper__.column_attrs.keys()
+        values = {name: value for name, value in fields.items() if name in columns}
+
+        # One UPDATE; no SELECT to load the campaign first
+        result = db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(status=status, **values)
+        )
+        db.commit()
 
-        if not campaign:
+        if not result.rowcount:
             logger.warning(f"Campaign {campaign_id} not found")
             return False
 
-        campaign.status = status
-
-        for field_name, field_value in fields.items():
-            if hasattr(campaign, field_name):
-                setattr(campaign, field_name, field_value)
-
-        db.commit()
-
         logger.debug(f"Updated campaign {campaign_id} to {status}")
         return True
 
@@ -0,0 +1,139 @@
+# app/workers/processor.py
+"""Campaign processing entry points and their event-loop handling."""
+
+import asyncio
+import sys
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from app.core.config import get_settings
+from app.core.database import WorkerSessionLocal
+from app.models.campaign import Campaign
+
+try:
+    # Installed with uvicorn[standard] everywhere except Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+if sys.platform == "win32":
+    # Playwright needs subprocess support, which only the Proactor loop has
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+# One long-lived loop, on its own thread, that every campaign run is posted to.
+# CampaignProcessor hands its blocking DB calls to asyncio.to_thread so that
+# concurrent campaigns never stall each other on this loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+
+def _new_loop() -> asyncio.AbstractEventLoop:
+    if sys.platform == "win32":
+        return asyncio.ProactorEventLoop()
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _run_worker_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared campaign loop, starting its thread on first use."""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            _worker_loop = _new_loop()
+            threading.Thread(
+                target=_run_worker_loop,
+                args=(_worker_loop,),
+                name="campaign-worker-loop",
+                daemon=True,
+            ).start()
+            logger.info(
+                f"Started shared {type(_worker_loop).__name__} for campaign processing"
+            )
+        return _worker_loop
+
+
+async def process_campaign_async(campaign_id: str, user_id: Optional[str] = None):
+    """Process campaign asynchronously."""
+    from .campaign_processor import CampaignProcessor
+
+    try:
+        processor = CampaignProcessor(campaign_id, user_id=user_id)
+        await processor.run()
+        logger.info(f"Campaign {campaign_id[:8]} completed successfully")
+    except Exception as e:
+        logger.error(f"Campaign {campaign_id[:8]} failed: {e}")
+        raise
+
+
+def process_campaign(
+    campaign_id: str, user_id: Optional[str] = None, headless: Optional[bool] = None
+):
+    """
+    Process campaign synchronously.
+
+    Args:
+        campaign_id: UUID of the campaign to process
+        user_id: Optional UUID of the user (if not provided, will be fetched from campaign)
+        headless: Optional browser headless mode setting
+    """
+    settings = get_settings()
+
+    # Check environment variables for browser settings
+    import os
+
+    # Override headless based on environment variable
+    if os.getenv("DEV_AUTOMATION_HEADFUL", "false").lower() == "true":
+        headless = False
+    elif headless is None:
+        headless = os.getenv("BROWSER_HEADLESS", "true").lower() == "true"
+
+    # Validate campaign_id format
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid campaign_id format: {e}")
+
+    # If user_id not provided, fetch from campaign
+    if not user_id:
+        db = WorkerSessionLocal()
+        try:
+            campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+            if campaign:
+                user_id = str(campaign.user_id)
+                logger.info(
+                    f"Retrieved user_id {user_id[:8]} for campaign {campaign_id[:8]}"
+                )
+            else:
+                logger.warning(f"Campaign {campaign_id[:8]} not found in database")
+        except Exception as e:
+            logger.error(f"Error fetching campaign user_id: {e}")
+        finally:
+            db.close()
+
+    logger.info(
+        f"Starting campaign processing: {campaign_id[:8]} for user {user_id[:8] if user_id else 'unknown'} (headless={headless})"
+    )
+
+    # Executor, DNS cache and HTTP pools on the shared loop outlive each run
+    future = asyncio.run_coroutine_threadsafe(
+        process_campaign_async(campaign_id, user_id), _get_worker_loop()
+    )
+
+    try:
+        # Block the calling thread until the campaign finishes
+        future.result()
+        logger.info(f"Campaign {campaign_id[:8]} completed")
+    except Exception as e:
+        logger.error(f"Campaign {campaign_id[:8]} failed: {e}")
+        raise
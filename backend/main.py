@@ -14,8 +14,10 @@ if sys.platform == "win32":
 
 import os
 import json
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # --- Logging
@@ -25,6 +27,9 @@ from app.logging import (
     LoggingMiddleware,
 )
 from app.logging.config import LoggingConfig
+from app.schemas.website import WEBSITE_SCHEMAS
+from app.services.auth_service import shutdown_bcrypt_pool
+from app.services.captcha_service import close_http_session
 
 # --- Routers
 from app.api import (
@@ -70,6 +75,10 @@ async def lifespan(app: FastAPI):
     policy = asyncio.get_event_loop_policy()
     logger.info(f"Event loop policy: {type(policy).__name__}")
 
+    # Build deferred website schema validators before serving traffic
+    for schema in WEBSITE_SCHEMAS:
+        schema.model_rebuild()
+
     # Log CAPTCHA integration status
     logger.info(
         "CAPTCHA integration: Death By Captcha support enabled via user profiles"
@@ -77,6 +86,8 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("Application shutting down")
+    await close_http_session()
+    shutdown_bcrypt_pool()
 
 
 # ----------------------------
@@ -87,13 +98,14 @@ def create_app() -> FastAPI:
     try:
         log_cfg = LoggingConfig()
         configure_logging(log_cfg)
+        # Root level for plain stdlib loggers; debug output is skipped entirely
+        logging.basicConfig(level=log_cfg.level.value)
     except Exception as e:
-        import logging
-
         logging.getLogger("uvicorn.error").warning(f"configure_logging() failed: {e}")
 
     app = FastAPI(
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         title=os.getenv("APP_NAME", "Contact Page Submitter"),
         version=os.getenv(
             "APP_VERSION", "2.0.0"